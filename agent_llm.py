@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import os
+import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from deck import Card, hand_to_str
+from deck import RANKS, SUITS, Card, hand_to_bitmask, hand_to_str
 from game_types import (
     BetDecision,
     BettingAction,
@@ -17,94 +34,437 @@ from game_types import (
     DecisionRules,
     DiscardDecision,
 )
-from hand_eval import evaluate_hand
+from engine import _conservative_fallback
+from hand_eval import HandEvaluation, evaluate_hand
 
 try:
-    from openai import AzureOpenAI  # type: ignore
+    from openai import (  # type: ignore
+        APIConnectionError,
+        APITimeoutError,
+        AsyncAzureOpenAI,
+        AzureOpenAI,
+        InternalServerError,
+        NotFoundError,
+        RateLimitError,
+    )
 except ImportError:  # pragma: no cover - optional dependency
     AzureOpenAI = None  # type: ignore
+    AsyncAzureOpenAI = None  # type: ignore
+
+    class _OpenAIUnavailableError(Exception):
+        """Placeholder so error classification works without the openai package."""
+
+    APIConnectionError = APITimeoutError = _OpenAIUnavailableError  # type: ignore
+    InternalServerError = NotFoundError = RateLimitError = _OpenAIUnavailableError  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 
 DEFAULT_API_VERSION = "2025-01-01-preview"
 DEFAULT_DEPLOYMENT_NAME = "gpt-4o-new"
 DEFAULT_MODEL_ID = "azure_openai:gpt-4o"
 
+_DecisionT = TypeVar("_DecisionT", DiscardDecision, BetDecision)
+
+# Discard and bet replies are small JSON objects whose free-form rationale the
+# prompts keep short; the cap bounds latency while leaving room for it.
+_MAX_OUTPUT_TOKENS: Final = 256
+# Transient API failures and undecodable replies are worth asking again. Any
+# other error, such as a 400/401/403/404 status, fails identically on retry, so
+# it is reported once and the caller falls back.
+_RETRYABLE_ERRORS = (
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+    ValueError,
+)
+
+_BACKOFF_BASE: Final = 0.5
+_BACKOFF_CAP: Final = 2.0
+# Private stream so retry jitter never perturbs seeded game randomness.
+_BACKOFF_RNG = random.Random()
+
+
+def _json_dumps(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _json_dumps_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
-def _rank_value(rank: str) -> int:
-    order = "23456789TJQKA"
-    return order.index(rank) + 2
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
-def _conservative_fallback(hand: List[Card], rules: DecisionRules) -> DiscardDecision:
-    max_allowed = min(rules.max_discards, 3)
-    if max_allowed <= 0:
+def _is_quota_error(exc: Exception) -> bool:
+    # Exhausted billing quota surfaces as a 429 carrying the ``insufficient_quota`` code.
+    return isinstance(exc, RateLimitError) and getattr(exc, "code", None) == "insufficient_quota"
+
+
+_RANK_BIT: Final[Dict[str, int]] = {rank: 1 << index for index, rank in enumerate(RANKS)}
+_SUIT_NIBBLE: Final[Dict[str, int]] = {suit: 1 << index for index, suit in enumerate(SUITS)}
+# Five consecutive rank bits, plus the A-2-3-4-5 wheel.
+_STRAIGHT_MASKS: Final = frozenset(
+    [0b11111 << low for low in range(len(RANKS) - 4)] + [0b1000000001111]
+)
+_SUITS_BY_LETTER_DESC: Final = tuple(sorted(SUITS, reverse=True))
+
+
+def _trivial_discard(hand: List[Card], rules: DecisionRules) -> Optional[DiscardDecision]:
+    """Return the obvious draw when no drawing is allowed or the hand is already made.
+
+    Made hands are recognised from the rank bitmask alone, without a full evaluation.
+    """
+
+    if rules.max_discards <= 0:
         return DiscardDecision([])
-    values = [_rank_value(card.rank) for card in hand]
-    counts: Dict[int, int] = {}
-    for value in values:
-        counts[value] = counts.get(value, 0) + 1
-    keep_indices = {
-        index for index, value in enumerate(values) if counts[value] >= 2
+    if len(hand) != 5:
+        return None
+    rank_bit = _RANK_BIT
+    rank_bits = 0
+    for card in hand:
+        rank_bits |= rank_bit[card.rank]
+    distinct = rank_bits.bit_count()
+    if distinct == 2:
+        # Either a full house or quads; a lone first rank or four of it means quads.
+        first = hand[0].rank
+        matches = sum(1 for card in hand if card.rank == first)
+        if matches == 1:
+            return DiscardDecision([0], rationale="Trivial: four of a kind, redraw kicker")
+        if matches == 4:
+            kicker = next(index for index, card in enumerate(hand) if card.rank != first)
+            return DiscardDecision([kicker], rationale="Trivial: four of a kind, redraw kicker")
+        return DiscardDecision([], rationale="Trivial: hand already made")
+    suit = hand[0].suit
+    if all(card.suit == suit for card in hand):
+        return DiscardDecision([], rationale="Trivial: hand already made")
+    if distinct == 5 and (rank_bits in _STRAIGHT_MASKS):
+        return DiscardDecision([], rationale="Trivial: hand already made")
+    return None
+
+
+def _retry_backoff(attempt: int) -> float:
+    """Capped exponential backoff with jitter so concurrent agents desynchronise."""
+    delay = min(_BACKOFF_CAP, _BACKOFF_BASE * (2 ** (attempt - 1)))
+    return delay * (0.5 + _BACKOFF_RNG.random() * 0.5)
+
+
+@lru_cache(maxsize=2048)
+def _discard_user_content(hand: Tuple[str, ...], max_discards: int) -> str:
+    # Keyed on the dealt order because the model answers with positional indices.
+    payload = {
+        "hand": list(hand),
+        "rules": {"max_discards": max_discards},
+        "task": "Return indices of cards to discard (0-4).",
     }
-    discard_candidates = [
-        (values[index], index) for index in range(len(hand)) if index not in keep_indices
-    ]
-    discard_candidates.sort()
-    chosen = [index for _, index in discard_candidates[:max_allowed]]
-    return DiscardDecision(sorted(chosen), rationale="Fallback: keep made pairs")
+    return _json_dumps(payload)
+
+
+@lru_cache(maxsize=64)
+def _action_values(actions: Tuple[BettingAction, ...]) -> Tuple[str, ...]:
+    # Only a handful of action sets occur, so their wire form is built once.
+    return tuple(action.value for action in actions)
+
+
+class _TruncatedResponseError(RuntimeError):
+    """The reply hit the output cap; a deterministic retry would be cut off again."""
+
+
+def _response_json(response: Any) -> Dict[str, Any]:
+    try:
+        choice = response.choices[0]
+        content = choice.message.content
+    except (AttributeError, IndexError, TypeError):
+        choice = content = None
+    if getattr(choice, "finish_reason", None) == "length":
+        raise _TruncatedResponseError("LLM response exceeded the output token cap")
+    if not content:
+        raise ValueError("Empty LLM response")
+    parsed = _json_loads(content)
+    if not isinstance(parsed, dict):
+        raise ValueError("LLM response must be a JSON object")
+    return parsed
+
+
+def _parse_discard_payload(parsed: Dict[str, Any]) -> DiscardDecision:
+    """Decode a discard payload, enforcing the JSON schema's types in one pass.
+
+    Type errors raise ``ValueError`` so the retry loop asks the model again
+    instead of silently falling back.
+    """
+
+    indices = parsed.get("discard_indices", [])
+    if not isinstance(indices, list):
+        raise ValueError("discard_indices must be a list")
+    for idx in indices:
+        if type(idx) is not int:
+            raise ValueError(f"Discard index must be integer: {idx!r}")
+    rationale = parsed.get("rationale")
+    if rationale is not None and not isinstance(rationale, str):
+        raise ValueError("rationale must be a string")
+    return DiscardDecision(discard_indices=indices, rationale=rationale)
+
+
+def _parse_bet_payload(parsed: Dict[str, Any]) -> BetDecision:
+    action_raw = parsed.get("action")
+    if not isinstance(action_raw, str):
+        raise ValueError("Invalid action returned")
+    action_value = action_raw.lower()
+    try:
+        action = BettingAction(action_value)
+    except ValueError as exc:
+        raise ValueError(f"Unsupported action: {action_value}") from exc
+    amount = parsed.get("amount", 0)
+    if not isinstance(amount, int):
+        raise ValueError("Amount must be integer")
+    return BetDecision(action=action, amount=amount, rationale=parsed.get("rationale"))
+
+
+# Compact on load once the log holds this many records per live key.
+_COMPACTION_RATIO: Final = 2
+_COMPACTION_SLACK: Final = 64
+_COMPACTION_BUFFER: Final = 1 << 20
 
 
 class DecisionCache:
-    """Simple disk-backed cache for LLM discard decisions."""
+    """Disk-backed cache for LLM discard decisions.
 
-    def __init__(self, path: Optional[str] = None) -> None:
+    Entries are persisted as an append-only JSONL log (one ``{"k", "v"}``
+    record per line, last write wins) so that ``sync`` only writes the
+    decisions added since the previous flush. ``compact`` rewrites the log
+    with a single record per key. With ``flush_interval`` set, a daemon
+    thread syncs every interval or once ``flush_threshold`` entries queue up.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        flush_interval: Optional[float] = None,
+        flush_threshold: int = 64,
+    ) -> None:
         self._path = path
         self._entries: Dict[str, Dict[str, Any]] = {}
-        self._dirty = False
+        self._pending: List[bytes] = []
+        self._needs_compaction = False
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._flush_threshold = max(1, flush_threshold)
+        self._wake: Optional[threading.Event] = None
+        self._stopped = False
+        self._writer: Optional[threading.Thread] = None
         if path and os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            if isinstance(data, dict):
-                self._entries.update(data)
+            self._load(path)
+        if path and flush_interval and flush_interval > 0:
+            self._wake = threading.Event()
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                args=(flush_interval,),
+                name="decision-cache-writer",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _load(self, path: str) -> None:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+        lines = [line for line in raw.splitlines() if line.strip()]
+        for position, line in enumerate(lines):
+            try:
+                record = _json_loads(line)
+            except ValueError:
+                if position == 0:
+                    self._load_legacy(raw)
+                    return
+                # A torn trailing write from an interrupted run; skip it.
+                self._needs_compaction = True
+                continue
+            if not isinstance(record, dict):
+                continue
+            if "k" in record and "v" in record:
+                self._entries[record["k"]] = record["v"]
+            elif position == 0:
+                self._load_legacy(raw)
+                return
+        if len(lines) > _COMPACTION_RATIO * len(self._entries) + _COMPACTION_SLACK:
+            # Mostly superseded records: rewrite once so later loads stay O(live keys).
+            self._needs_compaction = True
+
+    def _load_legacy(self, raw: bytes) -> None:
+        # Older caches were a single indented JSON document keyed by cache key.
+        data = _json_loads(raw)
+        if isinstance(data, dict):
+            self._entries.update(data)
+        self._needs_compaction = True
 
     def get(self, key: str) -> Optional[DiscardDecision]:
         value = self._entries.get(key)
         if value is None:
             return None
-        return DiscardDecision(list(value["discard_indices"]), value.get("rationale"))
+        indices = value["discard_indices"]
+        if type(indices) is not tuple:
+            # Entries loaded from disk hold lists; freeze once so hits can share them.
+            indices = value["discard_indices"] = tuple(indices)
+        return DiscardDecision(indices, value.get("rationale"))
 
     def set(self, key: str, decision: DiscardDecision) -> None:
-        self._entries[key] = {
-            "discard_indices": list(decision.discard_indices),
+        entry = {
+            "discard_indices": tuple(decision.discard_indices),
             "rationale": decision.rationale,
         }
-        self._dirty = True
+        if not self._path:
+            self._entries[key] = entry
+            return
+        record = _json_dumps_bytes({"k": key, "v": entry}) + b"\n"
+        with self._lock:
+            self._entries[key] = entry
+            self._pending.append(record)
+            backlog = len(self._pending)
+        if self._wake is not None and backlog >= self._flush_threshold:
+            self._wake.set()
 
     def sync(self) -> None:
-        if not self._path or not self._dirty:
+        if not self._path:
+            return
+        with self._io_lock:
+            if self._needs_compaction:
+                self._compact_locked()
+                return
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+            try:
+                self._ensure_directory()
+                with open(self._path, "ab") as handle:
+                    handle.writelines(pending)
+            except BaseException:
+                with self._lock:
+                    self._pending[:0] = pending
+                raise
+
+    def compact(self) -> None:
+        """Rewrite the log with exactly one record per cached key."""
+
+        if not self._path:
             return
+        with self._io_lock:
+            self._compact_locked()
+
+    def close(self) -> None:
+        """Stop the background writer, if any, and flush outstanding entries."""
+
+        if self._writer is not None and self._wake is not None:
+            self._stopped = True
+            self._wake.set()
+            self._writer.join()
+            self._writer = None
+        self.sync()
+
+    def _compact_locked(self) -> None:
+        assert self._path is not None
+        with self._lock:
+            snapshot = list(self._entries.items())
+            self._pending.clear()
+        self._ensure_directory()
+        tmp_path = f"{self._path}.tmp"
+        try:
+            with open(tmp_path, "wb", buffering=_COMPACTION_BUFFER) as handle:
+                handle.writelines(
+                    _json_dumps_bytes({"k": key, "v": entry}) + b"\n"
+                    for key, entry in snapshot
+                )
+                handle.flush()
+                # Make the data durable before the rename can expose it.
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            self._needs_compaction = True
+            raise
+        self._needs_compaction = False
+
+    def _writer_loop(self, interval: float) -> None:
+        assert self._wake is not None
+        while not self._stopped:
+            self._wake.wait(interval)
+            self._wake.clear()
+            try:
+                self.sync()
+            except OSError as exc:
+                print(f"⚠️ 决策缓存写入失败: {exc}")
+
+    def _ensure_directory(self) -> None:
+        assert self._path is not None
         directory = os.path.dirname(self._path)
         if directory:
             os.makedirs(directory, exist_ok=True)
-        with open(self._path, "w", encoding="utf-8") as handle:
-            json.dump(self._entries, handle, ensure_ascii=False, indent=2)
-        self._dirty = False
+
+
+_CACHE_REGISTRY: Dict[str, DecisionCache] = {}
+_CACHE_REGISTRY_LOCK = threading.Lock()
+
+
+def get_cache(path: Optional[str], *, flush_interval: Optional[float] = None) -> DecisionCache:
+    """Return the process-wide cache for ``path`` so agents sharing a file share entries.
+
+    The first caller's ``flush_interval`` wins; caches without a path are never shared.
+    """
+
+    if not path:
+        return DecisionCache(None)
+    key = os.path.abspath(path)
+    with _CACHE_REGISTRY_LOCK:
+        cache = _CACHE_REGISTRY.get(key)
+        if cache is None:
+            cache = _CACHE_REGISTRY[key] = DecisionCache(path, flush_interval=flush_interval)
+        return cache
 
 
 def _canonicalize_hand(hand: Iterable[Card]) -> str:
-    suit_order: Dict[str, str] = {}
-    next_symbol = ord("a")
+    return _canonicalize_mask(hand_to_bitmask(hand))
+
+
+@lru_cache(maxsize=4096)
+def _canonicalize_mask(mask: int) -> str:
+    symbols: Dict[str, str] = {}
     parts = []
-    for card in sorted(hand, key=lambda c: (_rank_value(c.rank), c.suit), reverse=True):
-        mapped = suit_order.get(card.suit)
-        if mapped is None:
-            mapped = chr(next_symbol)
-            suit_order[card.suit] = mapped
-            next_symbol += 1
-        parts.append(f"{card.rank}{mapped}")
+    # Highest rank first; within a rank, suits in reverse letter order (S, H, D, C).
+    for rank_index in range(len(RANKS) - 1, -1, -1):
+        nibble = (mask >> (rank_index * 4)) & 0b1111
+        if not nibble:
+            continue
+        rank = RANKS[rank_index]
+        for suit in _SUITS_BY_LETTER_DESC:
+            if nibble & _SUIT_NIBBLE[suit]:
+                # Suits are relabelled a, b, c, d in order of first appearance.
+                if suit not in symbols:
+                    symbols[suit] = "abcd"[len(symbols)]
+                parts.append(f"{rank}{symbols[suit]}")
     return "-".join(parts)
 
 
+@lru_cache(maxsize=4096)
+def _discard_cache_key(model: str, max_discards: int, mask: int) -> str:
+    return f"{model}|{max_discards}|{_canonicalize_mask(mask)}"
+
+
 JSON_SCHEMA = {
     "type": "json_schema",
     "json_schema": {
@@ -135,9 +495,12 @@ SYSTEM_PROMPT = (
     "You are a poker assistant playing Five-card draw.\n"
     "Rules: one draw round; you may discard 0-5 cards once; unknown cards are uniformly random.\n"
     "Goal: maximize final 5-card hand strength.\n"
-    "Output strictly in the required JSON schema. No extra text."
+    "Output strictly in the required JSON schema. No extra text.\n"
+    "Keep any rationale under 25 words."
 )
 
+_SYSTEM_MESSAGE: Dict[str, str] = {"role": "system", "content": SYSTEM_PROMPT}
+
 
 BET_JSON_SCHEMA = {
     "type": "json_schema",
@@ -170,11 +533,20 @@ BET_SYSTEM_PROMPT = (
     "Only one betting round occurs before the draw.\n"
     "Choose the best action among the allowed options.\n"
     "If the evaluated hand is already strong (pairs or better), favour aggressive betting/raising even if it means higher risk.\n"
-    "Respond strictly with the required JSON schema."
+    "Respond strictly with the required JSON schema.\n"
+    "Keep any rationale under 25 words."
 )
 
+_BET_SYSTEM_MESSAGE: Dict[str, str] = {"role": "system", "content": BET_SYSTEM_PROMPT}
+
 
-@dataclass
+# Heuristic betting tables indexed by ``HandEvaluation.rank_id``.
+_BET_PROBABILITY: Final[Tuple[float, ...]] = (0.5, 0.75, 0.9, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0)
+_BET_DIVISOR: Final[Tuple[int, ...]] = (8, 6, 4, 4, 3, 3, 3, 3, 3)
+_RAISE_PROBABILITY: Final[Tuple[float, ...]] = (0.1, 0.2, 0.3, 0.45, 0.65, 0.8, 0.9, 0.9, 0.9)
+
+
+@dataclass(slots=True)
 class LLMAgentMetrics:
     cache_hits: int = 0
     cache_misses: int = 0
@@ -206,23 +578,42 @@ class LLMAgent:
         max_retries: int = 3,
         timeout: float = 5.0,
         client: Optional[Any] = None,
+        async_client: Optional[Any] = None,
         cache_path: Optional[str] = None,
+        cache_flush_interval: Optional[float] = None,
         bet_mode: str = "heuristic",
+        prompt_cache_key: Optional[bool] = None,
     ) -> None:
         self.model = model
+        # ``prompt_cache_key`` is rejected with a 400 by Azure api-versions that
+        # predate it, so it is only sent when explicitly enabled.
+        if prompt_cache_key is None:
+            prompt_cache_key = _env_flag("AZURE_OPENAI_PROMPT_CACHE_KEY")
+        self.prompt_cache_key = prompt_cache_key
         self.temperature = temperature
         self.max_retries = max_retries
         self.timeout = timeout
         self._client = client
         self._client_checked = client is not None
-        self._cache = DecisionCache(cache_path)
+        self._async_client = async_client
+        self._async_client_checked = async_client is not None
+        self._cache = get_cache(cache_path, flush_interval=cache_flush_interval)
+        self._in_flight: Dict[str, "asyncio.Future[None]"] = {}
         self._metrics = LLMAgentMetrics()
         self._quota_error_shown = False  # 标记是否已显示配额错误提示
         self.bet_mode = bet_mode if bet_mode in {"heuristic", "llm"} else "heuristic"
 
     @staticmethod
     def create_default_client() -> Any:
-        if AzureOpenAI is None:
+        return LLMAgent._build_default_client(AzureOpenAI)
+
+    @staticmethod
+    def create_default_async_client() -> Any:
+        return LLMAgent._build_default_client(AsyncAzureOpenAI)
+
+    @staticmethod
+    def _build_default_client(factory: Optional[Callable[..., Any]]) -> Any:
+        if factory is None:
             print(
                 "⚠️ 未安装 openai 库（或版本过旧），"
                 "请运行 `uv pip install \"openai>=1.14\"` 后重试"
@@ -246,10 +637,12 @@ class LLMAgent:
         if http_proxy or https_proxy:
             print(f"🌐 检测到代理设置: HTTP={http_proxy}, HTTPS={https_proxy}")
 
-        return AzureOpenAI(
+        return factory(
             api_key=api_key,
             azure_endpoint=endpoint,
             api_version=api_version,
+            # Retries are handled by LLMAgent so backoff and metrics stay in one place.
+            max_retries=0,
         )
 
     def metrics(self) -> Dict[str, float]:
@@ -259,8 +652,17 @@ class LLMAgent:
         self._cache.sync()
 
     def decide_discard(
-        self, hand: List[Card], rules: DecisionRules, context: DecisionContext
+        self,
+        hand: List[Card],
+        rules: DecisionRules,
+        context: Optional[DecisionContext] = None,
     ) -> DiscardDecision:
+        """Choose discards; ``context`` is accepted for agent-interface parity and unused."""
+
+        trivial = _trivial_discard(hand, rules)
+        if trivial is not None:
+            return trivial
+
         key = self._cache_key(hand, rules)
         cached = self._cache.get(key)
         if cached is not None:
@@ -272,6 +674,68 @@ class LLMAgent:
         client = self._ensure_client()
         if client is not None:
             decision = self._call_llm_with_retries(client, hand, rules)
+        return self._store_discard(key, hand, rules, decision)
+
+    async def decide_discard_async(
+        self,
+        hand: List[Card],
+        rules: DecisionRules,
+        context: Optional[DecisionContext] = None,
+    ) -> DiscardDecision:
+        """Async variant of :meth:`decide_discard` backed by ``AsyncAzureOpenAI``."""
+
+        trivial = _trivial_discard(hand, rules)
+        if trivial is not None:
+            return trivial
+
+        key = self._cache_key(hand, rules)
+        in_flight = self._in_flight.get(key)
+        while in_flight is not None:
+            # An identical hand is already being asked about in this batch. If
+            # that call failed, another waiter may have taken over; wait again.
+            await asyncio.shield(in_flight)
+            in_flight = self._in_flight.get(key)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._metrics.cache_hits += 1
+            return cached
+
+        self._metrics.cache_misses += 1
+        done = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = done
+        try:
+            decision = None
+            client = self._ensure_async_client()
+            if client is not None:
+                decision = await self._call_llm_with_retries_async(client, hand, rules)
+            return self._store_discard(key, hand, rules, decision)
+        finally:
+            if self._in_flight.get(key) is done:
+                del self._in_flight[key]
+            done.set_result(None)
+
+    async def decide_discards_async(
+        self,
+        requests: Sequence[Tuple[List[Card], DecisionRules, Optional[DecisionContext]]],
+    ) -> List[DiscardDecision]:
+        """Resolve many discard decisions concurrently, preserving input order."""
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.decide_discard_async(hand, rules, context)
+                    for hand, rules, context in requests
+                )
+            )
+        )
+
+    def _store_discard(
+        self,
+        key: str,
+        hand: List[Card],
+        rules: DecisionRules,
+        decision: Optional[DiscardDecision],
+    ) -> DiscardDecision:
         if decision is None or not self._validate_decision(decision, len(hand), rules):
             self._metrics.fallbacks += 1
             decision = _conservative_fallback(hand, rules)
@@ -279,8 +743,7 @@ class LLMAgent:
         return decision
 
     def _cache_key(self, hand: Iterable[Card], rules: DecisionRules) -> str:
-        canonical = _canonicalize_hand(hand)
-        return f"{self.model}|{rules.max_discards}|{canonical}"
+        return _discard_cache_key(self.model, rules.max_discards, hand_to_bitmask(hand))
 
     def _ensure_client(self) -> Optional[Any]:
         if self._client_checked:
@@ -290,94 +753,144 @@ class LLMAgent:
         self._client = client
         return client
 
+    def _ensure_async_client(self) -> Optional[Any]:
+        if self._async_client_checked:
+            return self._async_client
+        self._async_client_checked = True
+        client = self.create_default_async_client()
+        self._async_client = client
+        return client
+
     def _call_llm_with_retries(
         self, client: Any, hand: List[Card], rules: DecisionRules
     ) -> Optional[DiscardDecision]:
-        payload = {
-            "hand": hand_to_str(hand),
-            "rules": {"max_discards": rules.max_discards},
-            "task": "Return indices of cards to discard (0-4).",
+        request = self._discard_request(hand, rules)
+        return self._retry_json_call(client, request, _parse_discard_payload, "discard")
+
+    async def _call_llm_with_retries_async(
+        self, client: Any, hand: List[Card], rules: DecisionRules
+    ) -> Optional[DiscardDecision]:
+        request = self._discard_request(hand, rules)
+        return await self._retry_json_call_async(
+            client, request, _parse_discard_payload, "discard"
+        )
+
+    def _discard_request(self, hand: List[Card], rules: DecisionRules) -> Dict[str, Any]:
+        content = _discard_user_content(tuple(hand_to_str(hand)), rules.max_discards)
+        return self._chat_request(_SYSTEM_MESSAGE, content, JSON_SCHEMA, "discard")
+
+    def _chat_request(
+        self,
+        system_message: Dict[str, str],
+        user_content: str,
+        schema: Dict[str, Any],
+        label: str,
+    ) -> Dict[str, Any]:
+        request: Dict[str, Any] = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "response_format": schema,
+            "max_tokens": _MAX_OUTPUT_TOKENS,
+            "messages": [system_message, {"role": "user", "content": user_content}],
+            "timeout": self.timeout,
         }
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
-        ]
+        if self.prompt_cache_key:
+            request["extra_body"] = {"prompt_cache_key": f"fivecard-draw-{label}-{self.model}"}
+        return request
+
+    def _retry_json_call(
+        self,
+        client: Any,
+        request: Dict[str, Any],
+        parser: Callable[[Dict[str, Any]], _DecisionT],
+        label: str,
+    ) -> Optional[_DecisionT]:
         for attempt in range(1, self.max_retries + 1):
             try:
                 self._metrics.api_calls += 1
-                response = client.chat.completions.create(  # type: ignore[attr-defined]
-                    model=self.model,
-                    temperature=self.temperature,
-                    response_format=JSON_SCHEMA,
-                    messages=messages,
-                    timeout=self.timeout,
-                )
-                
-                # 简化响应处理逻辑
-                content = None
-                if hasattr(response, 'choices') and response.choices:
-                    message = response.choices[0].message
-                    if hasattr(message, 'content') and message.content:
-                        content = message.content
-                
-                if not content:
-                    raise ValueError("Empty LLM response")
-                    
-                parsed = json.loads(content)
-                decision = DiscardDecision(
-                    discard_indices=list(parsed.get("discard_indices", [])),
-                    rationale=parsed.get("rationale"),
-                )
-                return decision
-            except Exception as e:
-                # 提供用户友好的错误提示
-                if "insufficient_quota" in str(e):
-                    if not self._quota_error_shown:  # 只显示一次详细提示
-                        print("💳 OpenAI API配额不足!")
-                        print("   原因：OpenAI现在要求添加付费方式才能使用API")
-                        print("   解决方案：")
-                        print("   1. 访问 https://platform.openai.com/account/billing/overview")
-                        print("   2. 添加信用卡或借记卡作为付费方式")
-                        print("   3. 设置使用限额（可设置低金额如$5）")
-                        print("   4. 程序将自动回退到保守策略继续运行")
-                        self._quota_error_shown = True
-                elif "model_not_found" in str(e):
-                    print(f"🤖 模型 {self.model} 不可用，请检查模型名称或权限")
-                elif "Connection error" in str(e):
-                    print("🌐 网络连接错误，请检查代理设置或网络连接")
-                
-                self._metrics.invalid_responses += 1
+                response = client.chat.completions.create(**request)  # type: ignore[attr-defined]
+                return parser(_response_json(response))
+            except _RETRYABLE_ERRORS as exc:
+                self._report_llm_error(exc, label)
                 if attempt >= self.max_retries:
                     break
-                backoff = 0.5 * (2 ** (attempt - 1))
-                time.sleep(backoff)
+                time.sleep(_retry_backoff(attempt))
+            except Exception as exc:
+                # Anything else cannot succeed on retry; fall back instead of failing.
+                self._report_llm_error(exc, label)
+                break
         return None
 
+    async def _retry_json_call_async(
+        self,
+        client: Any,
+        request: Dict[str, Any],
+        parser: Callable[[Dict[str, Any]], _DecisionT],
+        label: str,
+    ) -> Optional[_DecisionT]:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self._metrics.api_calls += 1
+                response = await client.chat.completions.create(**request)  # type: ignore[attr-defined]
+                return parser(_response_json(response))
+            except _RETRYABLE_ERRORS as exc:
+                self._report_llm_error(exc, label)
+                if attempt >= self.max_retries:
+                    break
+                await asyncio.sleep(_retry_backoff(attempt))
+            except Exception as exc:
+                # Anything else cannot succeed on retry; fall back instead of failing.
+                self._report_llm_error(exc, label)
+                break
+        return None
+
+    def _report_llm_error(self, exc: Exception, label: str) -> None:
+        # 提供用户友好的错误提示
+        if _is_quota_error(exc):
+            if not self._quota_error_shown:  # 只显示一次详细提示
+                print(f"💳 OpenAI API配额不足 ({label} call)!")
+                print("   原因：OpenAI现在要求添加付费方式才能使用API")
+                print("   解决方案：")
+                print("   1. 访问 https://platform.openai.com/account/billing/overview")
+                print("   2. 添加信用卡或借记卡作为付费方式")
+                print("   3. 设置使用限额（可设置低金额如$5）")
+                print("   4. 程序将自动回退到保守策略继续运行")
+                self._quota_error_shown = True
+        elif isinstance(exc, NotFoundError):
+            print(f"🤖 模型 {self.model} 不可用，请检查模型名称或权限")
+        elif isinstance(exc, APIConnectionError):
+            print("🌐 网络连接错误，请检查代理设置或网络连接")
+
+        self._metrics.invalid_responses += 1
+
     def _validate_decision(
         self, decision: DiscardDecision, hand_size: int, rules: DecisionRules
     ) -> bool:
         indices = decision.discard_indices
-        if any((not isinstance(idx, int)) for idx in indices):
-            return False
-        if any(idx < 0 or idx >= hand_size for idx in indices):
-            return False
-        if len(set(indices)) != len(indices):
-            return False
         if len(indices) > rules.max_discards:
             return False
+        seen = set()
+        for idx in indices:
+            # ``type() is int`` also rejects bools, which JSON decoders never mix up.
+            if type(idx) is not int or idx < 0 or idx >= hand_size or idx in seen:
+                return False
+            seen.add(idx)
         return True
 
     def decide_bet(
         self, hand: List[Card], context: BettingContext
     ) -> BetDecision:
+        evaluation = evaluate_hand(hand)
         if self.bet_mode == "llm":
             client = self._ensure_client()
             if client is not None:
-                decision = self._call_bet_llm_with_retries(client, hand, context)
+                decision = self._call_bet_llm_with_retries(
+                    client, hand, context, evaluation
+                )
                 if decision and self._validate_bet(decision, context):
                     return decision
-        evaluation = evaluate_hand(hand)
-        available = set(context.available_actions)
+        # At most five actions: tuple membership beats building a set.
+        available = context.available_actions
         strength = evaluation.rank_id
         rng = context.rng
 
@@ -387,23 +900,11 @@ class LLMAgent:
             )
             should_bet = False
             if can_bet:
-                if strength >= 4:  # straight or better
-                    should_bet = True
-                elif strength >= 2:  # two pair or better
-                    should_bet = rng.random() < 0.9
-                elif strength == 1:  # one pair
-                    should_bet = rng.random() < 0.75
-                else:  # high card
-                    should_bet = rng.random() < 0.5
+                bet_probability = _BET_PROBABILITY[strength]
+                # Certain bets skip the draw so seeded simulations stay reproducible.
+                should_bet = bet_probability >= 1.0 or rng.random() < bet_probability
             if should_bet and can_bet:
-                if strength >= 4:
-                    divisor = 3
-                elif strength >= 2:
-                    divisor = 4
-                elif strength == 1:
-                    divisor = 6
-                else:
-                    divisor = 8
+                divisor = _BET_DIVISOR[strength]
                 baseline = max(context.stack // divisor, context.min_bet)
                 amount = max(context.min_bet, baseline)
                 amount = min(amount, context.stack)
@@ -429,22 +930,7 @@ class LLMAgent:
                     BettingAction.RAISE in available
                     and context.stack > call_amount + context.min_raise
                 ):
-                    raise_chance = 0.0
-                    if strength >= 6:
-                        raise_chance = 0.9
-                    elif strength >= 5:
-                        raise_chance = 0.8
-                    elif strength == 4:
-                        raise_chance = 0.65
-                    elif strength == 3:
-                        raise_chance = 0.45
-                    elif strength == 2:
-                        raise_chance = 0.3
-                    elif strength == 1:
-                        raise_chance = 0.2
-                    elif strength == 0:
-                        raise_chance = 0.1
-                    if rng.random() < raise_chance:
+                    if rng.random() < _RAISE_PROBABILITY[strength]:
                         desired = call_amount + max(context.min_raise, context.min_bet)
                         raise_target = min(desired, context.stack)
                         rationale = f"LLM heuristic: raise with {evaluation.rank_name}"
@@ -483,72 +969,37 @@ class LLMAgent:
         return True
 
     def _call_bet_llm_with_retries(
-        self, client: Any, hand: List[Card], context: BettingContext
+        self,
+        client: Any,
+        hand: List[Card],
+        context: BettingContext,
+        evaluation: HandEvaluation,
     ) -> Optional[BetDecision]:
         payload = {
             "hand": hand_to_str(hand),
-            "hand_rank": evaluate_hand(hand).rank_name,
+            "hand_rank": evaluation.rank_name,
             "pot": context.pot,
             "to_call": context.to_call,
             "current_bet": context.current_bet,
             "stack": context.stack,
             "min_bet": context.min_bet,
             "min_raise": context.min_raise,
-            "available_actions": [action.value for action in context.available_actions],
+            "available_actions": _action_values(context.available_actions),
         }
-        messages = [
-            {"role": "system", "content": BET_SYSTEM_PROMPT},
-            {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
-        ]
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                self._metrics.api_calls += 1
-                response = client.chat.completions.create(  # type: ignore[attr-defined]
-                    model=self.model,
-                    temperature=self.temperature,
-                    response_format=BET_JSON_SCHEMA,
-                    messages=messages,
-                    timeout=self.timeout,
-                )
-                content = None
-                if hasattr(response, "choices") and response.choices:
-                    message = response.choices[0].message
-                    if hasattr(message, "content") and message.content:
-                        content = message.content
-                if not content:
-                    raise ValueError("Empty LLM response")
-
-                parsed = json.loads(content)
-                action_raw = parsed.get("action")
-                if not isinstance(action_raw, str):
-                    raise ValueError("Invalid action returned")
-                action_value = action_raw.lower()
-                try:
-                    action = BettingAction(action_value)
-                except ValueError as exc:
-                    raise ValueError(f"Unsupported action: {action_value}") from exc
-                amount = parsed.get("amount", 0)
-                if not isinstance(amount, int):
-                    raise ValueError("Amount must be integer")
-                rationale = parsed.get("rationale")
-                return BetDecision(action=action, amount=amount, rationale=rationale)
-            except Exception as exc:  # noqa: BLE001
-                self._metrics.invalid_responses += 1
-                if self.bet_mode == "llm":
-                    if "insufficient_quota" in str(exc) and not self._quota_error_shown:
-                        print("💳 OpenAI API配额不足 (betting call)!")
-                        self._quota_error_shown = True
-                if attempt >= self.max_retries:
-                    break
-                backoff = 0.5 * (2 ** (attempt - 1))
-                time.sleep(backoff)
-        self._metrics.fallbacks += 1
-        return None
+        request = self._chat_request(
+            _BET_SYSTEM_MESSAGE, _json_dumps(payload), BET_JSON_SCHEMA, "bet"
+        )
+        decision = self._retry_json_call(client, request, _parse_bet_payload, "bet")
+        if decision is None:
+            self._metrics.fallbacks += 1
+        return decision
 
 
 __all__ = [
+    "DecisionCache",
     "LLMAgent",
     "DEFAULT_API_VERSION",
     "DEFAULT_DEPLOYMENT_NAME",
     "DEFAULT_MODEL_ID",
+    "get_cache",
 ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, Dict, List
 
 from deck import Card
 from game_types import (
@@ -30,38 +30,50 @@ class RandomAgent:
         count = context.rng.randint(0, max_allowed)
         if count == 0:
             return DiscardDecision([])
-        indices = list(range(len(hand)))
-        context.rng.shuffle(indices)
-        discard = sorted(indices[:count])
+        discard = sorted(context.rng.sample(range(len(hand)), count))
         return DiscardDecision(discard, rationale="Random baseline")
 
     def decide_bet(
         self, hand: List[Card], context: BettingContext
     ) -> BetDecision:
-        actions = list(context.available_actions)
-        choice = context.rng.choice(actions)
-
-        if choice == BettingAction.CHECK:
-            return BetDecision(action=choice, rationale="Random: check")
-
-        if choice == BettingAction.FOLD:
-            return BetDecision(action=choice, rationale="Random: fold")
-
-        if choice == BettingAction.CALL:
-            amount = min(context.to_call, context.stack)
-            return BetDecision(action=choice, amount=amount, rationale="Random: call")
-
-        # Betting or raising: pick smallest legal amount for simplicity
-        if choice == BettingAction.BET:
-            amount = max(context.min_bet, 0)
-            amount = min(amount, context.stack)
-            return BetDecision(action=choice, amount=amount, rationale="Random: bet")
-
-        # Raise
-        raise_amount = max(context.min_raise, 0)
-        target = context.to_call + raise_amount
-        target = min(target, context.stack)
-        return BetDecision(action=choice, amount=target, rationale="Random: raise")
+        choice = context.rng.choice(context.available_actions)
+        return _BET_HANDLERS[choice](context)
+
+
+def _random_check(context: BettingContext) -> BetDecision:
+    return BetDecision(action=BettingAction.CHECK, rationale="Random: check")
+
+
+def _random_fold(context: BettingContext) -> BetDecision:
+    return BetDecision(action=BettingAction.FOLD, rationale="Random: fold")
+
+
+def _random_call(context: BettingContext) -> BetDecision:
+    amount = min(context.to_call, context.stack)
+    return BetDecision(action=BettingAction.CALL, amount=amount, rationale="Random: call")
+
+
+# Betting or raising: pick smallest legal amount for simplicity
+def _random_bet(context: BettingContext) -> BetDecision:
+    amount = max(context.min_bet, 0)
+    amount = min(amount, context.stack)
+    return BetDecision(action=BettingAction.BET, amount=amount, rationale="Random: bet")
+
+
+def _random_raise(context: BettingContext) -> BetDecision:
+    raise_amount = max(context.min_raise, 0)
+    target = context.to_call + raise_amount
+    target = min(target, context.stack)
+    return BetDecision(action=BettingAction.RAISE, amount=target, rationale="Random: raise")
+
+
+_BET_HANDLERS: Dict[BettingAction, Callable[[BettingContext], BetDecision]] = {
+    BettingAction.CHECK: _random_check,
+    BettingAction.FOLD: _random_fold,
+    BettingAction.CALL: _random_call,
+    BettingAction.BET: _random_bet,
+    BettingAction.RAISE: _random_raise,
+}
 
 
 __all__ = ["RandomAgent"]
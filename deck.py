@@ -2,31 +2,50 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Final, Iterable, List, Sequence, Tuple
 
 
-RANKS: Sequence[str] = tuple("23456789TJQKA")
-SUITS: Sequence[str] = tuple("SHDC")  # Spades, Hearts, Diamonds, Clubs
+RANKS: Final[Sequence[str]] = tuple("23456789TJQKA")
+SUITS: Final[Sequence[str]] = tuple("SHDC")  # Spades, Hearts, Diamonds, Clubs
 
 
-@dataclass(frozen=True)
+_RANK_INDEX: Final[Dict[str, int]] = {rank: index for index, rank in enumerate(RANKS)}
+_SUIT_INDEX: Final[Dict[str, int]] = {suit: index for index, suit in enumerate(SUITS)}
+
+
+@dataclass(frozen=True, slots=True)
 class Card:
-    """Representation of a single playing card."""
+    """Representation of a single playing card.
+
+    ``code`` packs the card into ``rank_index * 4 + suit_index`` (0-51), so a
+    hand can be represented as a bitmask of ``1 << code``.
+    """
 
     rank: str
     suit: str
+    code: int = field(init=False, repr=False, compare=False)
 
-    def __post_init__(self) -> None:  # pragma: no cover - trivial dataclass validation
-        if self.rank not in RANKS:
+    def __post_init__(self) -> None:
+        rank_index = _RANK_INDEX.get(self.rank)
+        if rank_index is None:
             raise ValueError(f"Unknown rank: {self.rank}")
-        if self.suit not in SUITS:
+        suit_index = _SUIT_INDEX.get(self.suit)
+        if suit_index is None:
             raise ValueError(f"Unknown suit: {self.suit}")
+        object.__setattr__(self, "code", rank_index * 4 + suit_index)
+
+    def __hash__(self) -> int:
+        return self.code
 
     def __str__(self) -> str:
         return f"{self.rank}{self.suit}"
 
 
+# Built once at import; cards are immutable, so every deck can share them.
+_FULL_DECK: Final[Tuple[Card, ...]] = tuple(Card(rank, suit) for suit in SUITS for rank in RANKS)
+
+
 def card_from_str(card: str) -> Card:
     """Create a :class:`Card` from a compact string representation."""
 
@@ -47,6 +66,15 @@ def hand_to_str(hand: Sequence[Card]) -> List[str]:
     return [str(card) for card in hand]
 
 
+def hand_to_bitmask(hand: Iterable[Card]) -> int:
+    """Return the order-independent bitmask with bit ``card.code`` set per card."""
+
+    mask = 0
+    for card in hand:
+        mask |= 1 << card.code
+    return mask
+
+
 class Deck:
     """A standard 52-card deck with deterministic shuffling support."""
 
@@ -55,16 +83,23 @@ class Deck:
 
         self._rng = rng or random.Random()
         self._cards: List[Card] = []
+        self._top = 0
         self.reset()
 
     def reset(self) -> None:
         """Reset the deck to an ordered set of 52 cards."""
 
-        self._cards = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+        # Refill in place so a reused deck keeps its list allocation.
+        self._cards[:] = _FULL_DECK
+        self._top = 0
 
     def shuffle(self) -> None:
         """Shuffle the deck in-place using the configured RNG."""
 
+        if self._top:
+            # Drop the dealt prefix so only undealt cards are shuffled.
+            self._cards = self._cards[self._top :]
+            self._top = 0
         self._rng.shuffle(self._cards)
 
     def draw(self, count: int = 1) -> List[Card]:
@@ -72,16 +107,16 @@ class Deck:
 
         if count < 0:
             raise ValueError("count must be non-negative")
-        if count > len(self._cards):
+        top = self._top
+        if count > len(self._cards) - top:
             raise ValueError("Not enough cards remaining in the deck")
-        drawn = self._cards[:count]
-        self._cards = self._cards[count:]
-        return list(drawn)
+        self._top = top + count
+        return self._cards[top : top + count]
 
     def remaining(self) -> int:
         """Return the number of cards left in the deck."""
 
-        return len(self._cards)
+        return len(self._cards) - self._top
 
     def deal(self, num_players: int, cards_per_player: int) -> List[List[Card]]:
         """Deal ``cards_per_player`` cards to ``num_players`` players."""
@@ -91,7 +126,7 @@ class Deck:
         if cards_per_player <= 0:
             raise ValueError("cards_per_player must be positive")
         total_needed = num_players * cards_per_player
-        if total_needed > len(self._cards):
+        if total_needed > self.remaining():
             raise ValueError("Not enough cards to deal")
         hands = []
         for _ in range(num_players):
@@ -106,6 +141,7 @@ __all__ = [
     "SUITS",
     "card_from_str",
     "hand_from_strs",
+    "hand_to_bitmask",
     "hand_to_str",
 ]
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field, replace
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from deck import Card, Deck, hand_to_str
 from game_types import (
@@ -15,41 +15,104 @@ from game_types import (
     DecisionRules,
     DiscardDecision,
 )
-from hand_eval import HandEvaluation, compare_hands, evaluate_hand
-
-
-def _rank_value(rank: str) -> int:
-    order = "23456789TJQKA"
-    return order.index(rank) + 2
+from hand_eval import HandEvaluation, evaluate_hand
 
 
 def _conservative_fallback(hand: List[Card], rules: DecisionRules) -> DiscardDecision:
     max_allowed = min(rules.max_discards, 3)
     if max_allowed <= 0:
         return DiscardDecision([])
-    values = [_rank_value(card.rank) for card in hand]
-    counts: Dict[int, int] = {}
-    for value in values:
-        counts[value] = counts.get(value, 0) + 1
-    keep_indices = {
-        index for index, value in enumerate(values) if counts[value] >= 2
-    }
-    discard_candidates = [
-        (values[index], index) for index in range(len(hand)) if index not in keep_indices
-    ]
-    discard_candidates.sort()
+    # One bit per rank (``code >> 2`` is the rank index), so bit order is rank order
+    # and paired ranks fall out of a running OR without building a tally.
+    bits = [1 << (card.code >> 2) for card in hand]
+    seen = paired = 0
+    for bit in bits:
+        paired |= seen & bit
+        seen |= bit
+    discard_candidates = sorted(
+        (bit, index) for index, bit in enumerate(bits) if not bit & paired
+    )
     chosen = [index for _, index in discard_candidates[:max_allowed]]
     return DiscardDecision(sorted(chosen), rationale="Fallback: keep made pairs")
 
 
-def _apply_discard(hand: List[Card], discard_indices: Iterable[int], deck: Deck) -> List[Card]:
-    discard_set = set(discard_indices)
-    keep = [card for idx, card in enumerate(hand) if idx not in discard_set]
-    drawn = deck.draw(len(discard_set)) if discard_set else []
-    return keep + drawn
+def _validate_discard(indices: Iterable[int], hand_size: int, rules: DecisionRules) -> bool:
+    # Hands hold at most a handful of cards, so an int bitmask tracks repeats.
+    seen = 0
+    remaining = rules.max_discards
+    for index in indices:
+        if not isinstance(index, int) or index < 0 or index >= hand_size:
+            return False
+        bit = 1 << index
+        if seen & bit:
+            return False
+        seen |= bit
+        remaining -= 1
+        if remaining < 0:
+            return False
+    return True
+
+
+def _apply_discard(hand: List[Card], discard_indices: Sequence[int], deck: Deck) -> List[Card]:
+    # Hands are never mutated in place, so a stand-pat draw returns ``hand`` itself.
+    if not discard_indices:
+        return hand
+    mask = 0
+    for idx in discard_indices:
+        mask |= 1 << idx
+    keep = [card for idx, card in enumerate(hand) if not mask >> idx & 1]
+    return keep + deck.draw(mask.bit_count())
+
+
+def _legal_actions(facing_bet: bool, has_chips: bool, can_open: bool) -> Tuple[BettingAction, ...]:
+    if not facing_bet:
+        if has_chips and can_open:
+            return (BettingAction.CHECK, BettingAction.BET)
+        return (BettingAction.CHECK,)
+    if not has_chips:
+        return (BettingAction.FOLD,)
+    if can_open:
+        return (BettingAction.CALL, BettingAction.RAISE, BettingAction.FOLD)
+    return (BettingAction.CALL, BettingAction.FOLD)
+
+
+# Legal actions keyed by ``facing_bet << 2 | has_chips << 1 | can_open``, where
+# ``can_open`` means a bet is allowed when unopened, or a raise when facing one.
+_ACTION_TABLE: Dict[int, Tuple[BettingAction, ...]] = {
+    key: _legal_actions(bool(key & 4), bool(key & 2), bool(key & 1)) for key in range(8)
+}
+
+
+_NO_AMOUNT_ACTIONS = frozenset({BettingAction.CHECK, BettingAction.FOLD})
+_DEFAULT_PRIORITY = (
+    BettingAction.CHECK,
+    BettingAction.CALL,
+    BettingAction.BET,
+    BettingAction.RAISE,
+)
+
+
+def _default_action(actions: Sequence[BettingAction]) -> BettingAction:
+    for action in _DEFAULT_PRIORITY:
+        if action in actions:
+            return action
+    return BettingAction.FOLD
+
 
+# Fallback action for every table entry, so the common case is one dict hit.
+_DEFAULT_ACTIONS: Dict[Tuple[BettingAction, ...], BettingAction] = {
+    actions: _default_action(actions) for actions in _ACTION_TABLE.values()
+}
+_DEFAULT_AMOUNT: Dict[BettingAction, Callable[[BettingContext], int]] = {
+    BettingAction.CHECK: lambda context: 0,
+    BettingAction.FOLD: lambda context: 0,
+    BettingAction.CALL: lambda context: min(context.to_call, context.stack),
+    BettingAction.BET: lambda context: min(context.min_bet, context.stack),
+    BettingAction.RAISE: lambda context: min(context.to_call + context.min_raise, context.stack),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class BettingEvent:
     action: BettingAction
     amount: int
@@ -67,7 +130,13 @@ class BettingEvent:
         }
 
 
-@dataclass
+# During a hand, betting events are recorded as plain ``(action, amount, rationale,
+# pot_after, stack_after)`` rows and only materialised as :class:`BettingEvent`
+# once per player when the result is built.
+_EventRow = Tuple[BettingAction, int, Optional[str], int, int]
+
+
+@dataclass(slots=True)
 class PlayerResult:
     player_id: int
     name: str
@@ -82,16 +151,30 @@ class PlayerResult:
     stack_change: int
     betting_history: List[BettingEvent]
 
-    def to_dict(self) -> dict:
+    def to_dict(self, *, raw: bool = False) -> dict:
+        """Serialise the result; ``raw`` emits card codes and rank ids instead of names."""
+
+        indices = self.decision.discard_indices
+        final_eval = self.final_eval
+        if raw:
+            hand_before: List[Any] = [card.code for card in self.hand_before]
+            hand_after: List[Any] = [card.code for card in self.hand_after]
+            initial_rank: Any = self.initial_eval.rank_id
+            final_rank: Any = final_eval.rank_id if final_eval else None
+        else:
+            hand_before = hand_to_str(self.hand_before)
+            hand_after = hand_to_str(self.hand_after)
+            initial_rank = self.initial_eval.rank_name
+            final_rank = final_eval.rank_name if final_eval else None
         return {
             "player_id": self.player_id,
             "name": self.name,
-            "hand_before": hand_to_str(self.hand_before),
-            "hand_after": hand_to_str(self.hand_after),
-            "discard_indices": list(self.decision.discard_indices),
+            "hand_before": hand_before,
+            "hand_after": hand_after,
+            "discard_indices": list(indices),
             "rationale": self.decision.rationale,
-            "initial_rank": self.initial_eval.rank_name,
-            "final_rank": self.final_eval.rank_name if self.final_eval else None,
+            "initial_rank": initial_rank,
+            "final_rank": final_rank,
             "folded": self.folded,
             "initial_stack": self.initial_stack,
             "final_stack": self.final_stack,
@@ -100,7 +183,7 @@ class PlayerResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GameResult:
     game_id: int
     players: List[PlayerResult]
@@ -118,18 +201,18 @@ class GameResult:
     def is_draw(self) -> bool:
         return len(self.winners) > 1
 
-    def to_dict(self) -> dict:
+    def to_dict(self, *, raw: bool = False) -> dict:
         payload = {
             "game_id": self.game_id,
             "pot": self.pot,
             "winners": self.winners,
             "bankrolls": self.bankrolls,
         }
-        payload["players"] = [player.to_dict() for player in self.players]
+        payload["players"] = [player.to_dict(raw=raw) for player in self.players]
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerSeat:
     player_id: int
     name: str
@@ -137,7 +220,7 @@ class PlayerSeat:
     stack: int
 
 
-@dataclass
+@dataclass(slots=True)
 class _RoundPlayer:
     seat: PlayerSeat
     hand: List[Card]
@@ -146,7 +229,7 @@ class _RoundPlayer:
     committed: int = 0
     folded: bool = False
     all_in: bool = False
-    betting_history: List[BettingEvent] = field(default_factory=list)
+    _history: List[_EventRow] = field(default_factory=list)
     discard_decision: DiscardDecision = field(default_factory=DiscardDecision)
     hand_after: List[Card] = field(default_factory=list)
     initial_eval: Optional[HandEvaluation] = None
@@ -156,6 +239,97 @@ class _RoundPlayer:
     def player_id(self) -> int:
         return self.seat.player_id
 
+    @property
+    def betting_history(self) -> Tuple[BettingEvent, ...]:
+        """Read-only snapshot of the rows recorded so far this hand."""
+        return tuple(BettingEvent(*row) for row in self._history)
+
+    def to_result(self) -> PlayerResult:
+        seat = self.seat
+        return PlayerResult(
+            player_id=seat.player_id,
+            name=seat.name,
+            hand_before=self.hand,
+            hand_after=self.hand_after,
+            decision=self.discard_decision,
+            initial_eval=self.initial_eval,
+            final_eval=None if self.folded else self.final_eval,
+            folded=self.folded,
+            initial_stack=self.starting_stack,
+            final_stack=seat.stack,
+            stack_change=seat.stack - self.starting_stack,
+            betting_history=[BettingEvent(*row) for row in self._history],
+        )
+
+
+def _available_actions(
+    player: _RoundPlayer,
+    to_call: int,
+    rules: DecisionRules,
+    raises: int,
+) -> Tuple[BettingAction, ...]:
+    if player.folded:
+        return ()
+    stack = player.seat.stack
+    if to_call <= 0:
+        can_open = rules.min_bet > 0
+    else:
+        can_open = (
+            stack > to_call
+            and stack - to_call >= rules.min_bet
+            and raises < rules.max_raises
+        )
+    return _ACTION_TABLE[(to_call > 0) << 2 | (stack > 0) << 1 | can_open]
+
+
+def _determine_winners(players: List[_RoundPlayer]) -> List[_RoundPlayer]:
+    contenders = [player for player in players if not player.folded]
+    if len(contenders) < 2:
+        return contenders
+    if len(contenders) == 2:
+        # Heads-up showdown: a single key comparison settles it.
+        first, second = contenders
+        first_key = first.final_eval.score
+        second_key = second.final_eval.score
+        if first_key > second_key:
+            return [first]
+        if first_key < second_key:
+            return [second]
+        return contenders
+    # Every contender's final_eval is already computed; one pass builds each key once.
+    best = contenders[0].final_eval.score
+    winners = [contenders[0]]
+    for player in contenders[1:]:
+        key = player.final_eval.score
+        if key > best:
+            best = key
+            winners = [player]
+        elif key == best:
+            winners.append(player)
+    return winners
+
+
+def _pay_winners(winners: List[_RoundPlayer], pot: int) -> None:
+    """Split ``pot`` between ``winners``, odd chips going to the earliest seats."""
+
+    if len(winners) == 1:
+        # Uncontested or outright win: the whole pot moves in one step.
+        seat = winners[0].seat
+        seat.stack += pot
+        winners[0]._history.append((BettingAction.CALL, pot, "Payout", 0, seat.stack))
+        return
+    if not winners:
+        return
+    share, remainder = divmod(pot, len(winners))
+    remaining = pot
+    for idx, player in enumerate(winners):
+        payout = share + (1 if idx < remainder else 0)
+        player.seat.stack += payout
+        remaining -= payout
+        player._history.append(
+            (BettingAction.CALL, payout, "Payout", max(remaining, 0), player.seat.stack)
+        )
+
 
 class FiveCardDrawEngine:
     """Engine coordinating multi-agent Five-card draw with betting support."""
@@ -167,6 +341,7 @@ class FiveCardDrawEngine:
         self._seats: List[PlayerSeat] = [
             replace(player, player_id=index) for index, player in enumerate(players)
         ]
+        self._deck = Deck(rng=self.rng)
 
     def play_game(self, game_id: int, rules: Optional[DecisionRules] = None) -> GameResult:
         rules = rules or DecisionRules()
@@ -175,7 +350,8 @@ class FiveCardDrawEngine:
             bankrolls = {seat.player_id: seat.stack for seat in self._seats}
             return GameResult(game_id=game_id, players=[], pot=0, winners=[], bankrolls=bankrolls)
 
-        deck = Deck(rng=self.rng)
+        deck = self._deck
+        deck.reset()
         deck.shuffle()
 
         hands = deck.deal(len(active_seats), 5)
@@ -183,16 +359,18 @@ class FiveCardDrawEngine:
         pot = 0
 
         for seat, hand in zip(active_seats, hands):
+            initial_eval = evaluate_hand(hand)
             player = _RoundPlayer(
                 seat=seat,
-                hand=list(hand),
-                hand_after=list(hand),
+                hand=hand,
+                hand_after=hand,
                 starting_stack=seat.stack,
                 current_bet=0,
                 committed=0,
                 folded=False,
                 all_in=False,
-                initial_eval=evaluate_hand(list(hand)),
+                initial_eval=initial_eval,
+                final_eval=initial_eval,
             )
             if rules.ante > 0 and seat.stack > 0:
                 ante = min(rules.ante, seat.stack)
@@ -200,15 +378,7 @@ class FiveCardDrawEngine:
                 player.current_bet += ante
                 player.committed += ante
                 pot += ante
-                player.betting_history.append(
-                    BettingEvent(
-                        action=BettingAction.BET,
-                        amount=ante,
-                        rationale="Ante",
-                        pot_after=pot,
-                        stack_after=seat.stack,
-                    )
-                )
+                player._history.append((BettingAction.BET, ante, "Ante", pot, seat.stack))
                 if seat.stack == 0:
                     player.all_in = True
             round_players.append(player)
@@ -224,50 +394,15 @@ class FiveCardDrawEngine:
                 decision = self._obtain_discard(player.seat.agent, player.hand_after, rules, context)
                 player.discard_decision = decision
                 player.hand_after = _apply_discard(player.hand_after, decision.discard_indices, deck)
-                player.final_eval = evaluate_hand(player.hand_after)
-
-            winners = self._determine_winners([p for p in round_players if not p.folded])
-
-        if len(winners) > 0:
-            share, remainder = divmod(pot, len(winners))
-            remaining = pot
-            for idx, player in enumerate(winners):
-                payout = share + (1 if idx < remainder else 0)
-                player.seat.stack += payout
-                remaining -= payout
-                player.betting_history.append(
-                    BettingEvent(
-                        action=BettingAction.CALL,
-                        amount=payout,
-                        rationale="Payout",
-                        pot_after=max(remaining, 0),
-                        stack_after=player.seat.stack,
-                    )
-                )
-                player.final_eval = player.final_eval or player.initial_eval
-        else:
-            # No winners implies everyone folded? Nothing to distribute.
-            winners = []
-
-        players_result: List[PlayerResult] = []
-        for player in round_players:
-            final_eval = player.final_eval if not player.folded else None
-            result = PlayerResult(
-                player_id=player.player_id,
-                name=player.seat.name,
-                hand_before=player.hand,
-                hand_after=player.hand_after,
-                decision=player.discard_decision,
-                initial_eval=player.initial_eval,
-                final_eval=final_eval,
-                folded=player.folded,
-                initial_stack=player.starting_stack,
-                final_stack=player.seat.stack,
-                stack_change=player.seat.stack - player.starting_stack,
-                betting_history=player.betting_history,
-            )
-            players_result.append(result)
+                if player.hand_after is not player.hand:
+                    # Stand-pat hands keep the dealt list and its initial evaluation.
+                    player.final_eval = evaluate_hand(player.hand_after)
+
+            winners = _determine_winners([p for p in round_players if not p.folded])
 
+        _pay_winners(winners, pot)
+
+        players_result = [player.to_result() for player in round_players]
         bankrolls = {seat.player_id: seat.stack for seat in self._seats}
         winner_ids = [player.player_id for player in winners]
         return GameResult(
@@ -278,40 +413,6 @@ class FiveCardDrawEngine:
             bankrolls=bankrolls,
         )
 
-    def _available_actions(
-        self,
-        player: _RoundPlayer,
-        to_call: int,
-        rules: DecisionRules,
-        raises: int,
-    ) -> List[BettingAction]:
-        if player.folded:
-            return []
-        actions: List[BettingAction] = []
-        if to_call <= 0:
-            actions.append(BettingAction.CHECK)
-            if player.seat.stack > 0 and rules.min_bet > 0:
-                actions.append(BettingAction.BET)
-        else:
-            if player.seat.stack > 0:
-                actions.append(BettingAction.CALL)
-                if (
-                    player.seat.stack > to_call
-                    and player.seat.stack - to_call >= rules.min_bet
-                    and raises < rules.max_raises
-                ):
-                    actions.append(BettingAction.RAISE)
-            actions.append(BettingAction.FOLD)
-            if player.seat.stack <= to_call:
-                actions = [action for action in actions if action != BettingAction.RAISE]
-        if not actions and to_call <= 0:
-            actions.append(BettingAction.CHECK)
-        if BettingAction.CALL not in actions and to_call > 0 and player.seat.stack > 0:
-            actions.append(BettingAction.CALL)
-        if BettingAction.FOLD not in actions and to_call > 0:
-            actions.append(BettingAction.FOLD)
-        return actions
-
     def _betting_round(
         self,
         players: List[_RoundPlayer],
@@ -321,141 +422,108 @@ class FiveCardDrawEngine:
     ) -> int:
         current_bet = max((p.current_bet for p in players), default=0)
         raises = 0
-        players_needed = {
-            player.player_id
-            for player in players
-            if not player.folded and not player.all_in
-        }
-        index = 0
+        # Bit ``i`` tracks ``players[i]``: out_mask marks folded or all-in seats,
+        # needed_mask the seats that still have to act on the current bet.
         total_players = len(players)
+        full_mask = (1 << total_players) - 1
+        out_mask = 0
+        for position, p in enumerate(players):
+            if p.folded or p.all_in:
+                out_mask |= 1 << position
+        needed_mask = full_mask & ~out_mask
+        index = 0
+        active_count = sum(1 for p in players if not p.folded)
+        # Loop invariants bound once; the body runs per betting action.
+        min_bet = rules.min_bet
+        rng = self.rng
+        obtain_bet = self._obtain_bet
+        normalize_bet = self._normalize_bet
+        # Actions come back normalised to enum members, so identity checks suffice.
+        CHECK, BET, CALL, FOLD = (
+            BettingAction.CHECK,
+            BettingAction.BET,
+            BettingAction.CALL,
+            BettingAction.FOLD,
+        )
 
-        def active_non_folded() -> int:
-            return sum(1 for p in players if not p.folded)
-
-        while players_needed and active_non_folded() > 1:
-            player = players[index % total_players]
+        while needed_mask and active_count > 1:
+            position = index % total_players
+            player = players[position]
+            bit = 1 << position
             index += 1
             if player.folded or player.all_in:
-                players_needed.discard(player.player_id)
+                needed_mask &= ~bit
                 continue
 
+            seat = player.seat
             to_call = max(0, current_bet - player.current_bet)
-            available_actions = self._available_actions(player, to_call, rules, raises)
+            available_actions = _available_actions(player, to_call, rules, raises)
             if not available_actions:
-                players_needed.discard(player.player_id)
+                needed_mask &= ~bit
                 continue
 
             context = BettingContext(
                 game_id=game_id,
-                player_id=player.player_id,
+                player_id=seat.player_id,
                 round_id=0,
                 pot=pot,
                 to_call=to_call,
                 current_bet=current_bet,
-                min_bet=rules.min_bet,
-                min_raise=rules.min_bet,
-                stack=player.seat.stack,
+                min_bet=min_bet,
+                min_raise=min_bet,
+                stack=seat.stack,
                 committed=player.current_bet,
-                available_actions=tuple(available_actions),
-                rng=self.rng,
+                available_actions=available_actions,
+                rng=rng,
             )
-            decision = self._obtain_bet(player.seat.agent, player.hand_after, context)
-            decision = self._normalize_bet(decision, context)
+            decision = normalize_bet(obtain_bet(seat.agent, player.hand_after, context), context)
             action = decision.action
             amount = decision.amount if decision.amount else 0
 
-            if action == BettingAction.CHECK:
-                player.betting_history.append(
-                    BettingEvent(action, 0, decision.rationale, pot, player.seat.stack)
-                )
-                players_needed.discard(player.player_id)
-                continue
-
-            if action == BettingAction.FOLD:
-                player.folded = True
-                player.betting_history.append(
-                    BettingEvent(action, 0, decision.rationale, pot, player.seat.stack)
-                )
-                players_needed.discard(player.player_id)
-                if active_non_folded() <= 1:
-                    break
+            if action is CHECK or action is FOLD:
+                player._history.append((action, 0, decision.rationale, pot, seat.stack))
+                needed_mask &= ~bit
+                if action is FOLD:
+                    player.folded = True
+                    out_mask |= bit
+                    active_count -= 1
+                    if active_count <= 1:
+                        break
                 continue
 
-            if action == BettingAction.BET:
-                pay = min(max(amount, rules.min_bet), player.seat.stack)
+            stack = seat.stack
+            if action is CALL:
+                pay = min(max(amount, to_call), stack)
+            elif action is BET:
+                pay = min(max(amount, min_bet), stack)
                 if pay <= 0:
-                    pay = min(player.seat.stack, rules.min_bet)
-                player.seat.stack -= pay
-                player.current_bet += pay
-                player.committed += pay
-                pot += pay
-                current_bet = player.current_bet
-                raises = 1
-                player.betting_history.append(
-                    BettingEvent(action, pay, decision.rationale, pot, player.seat.stack)
-                )
-                players_needed = {
-                    p.player_id
-                    for p in players
-                    if not p.folded and not p.all_in and p.player_id != player.player_id
-                }
-                if player.seat.stack == 0:
-                    player.all_in = True
-                continue
-
-            if action == BettingAction.CALL:
-                pay = min(max(amount, to_call), player.seat.stack)
-                player.seat.stack -= pay
-                player.current_bet += pay
-                player.committed += pay
-                pot += pay
+                    pay = min(stack, min_bet)
+            else:
+                pay = min(max(amount, to_call + min_bet), stack)
+            stack -= pay
+            seat.stack = stack
+            player.current_bet += pay
+            player.committed += pay
+            pot += pay
+            player._history.append((action, pay, decision.rationale, pot, stack))
+
+            if action is CALL:
                 if player.current_bet < current_bet:
                     player.all_in = True
-                player.betting_history.append(
-                    BettingEvent(action, pay, decision.rationale, pot, player.seat.stack)
-                )
-                players_needed.discard(player.player_id)
+                    out_mask |= bit
+                needed_mask &= ~bit
                 continue
 
-            if action == BettingAction.RAISE:
-                minimum_total = to_call + rules.min_bet
-                pay = min(max(amount, minimum_total), player.seat.stack)
-                player.seat.stack -= pay
-                player.current_bet += pay
-                player.committed += pay
-                pot += pay
-                current_bet = player.current_bet
-                raises += 1
-                player.betting_history.append(
-                    BettingEvent(action, pay, decision.rationale, pot, player.seat.stack)
-                )
-                players_needed = {
-                    p.player_id
-                    for p in players
-                    if not p.folded and not p.all_in and p.player_id != player.player_id
-                }
-                if player.seat.stack == 0:
-                    player.all_in = True
-                continue
+            # A bet or raise reopens the action for everyone still able to act.
+            current_bet = player.current_bet
+            raises = 1 if action is BET else raises + 1
+            needed_mask = full_mask & ~out_mask & ~bit
+            if stack == 0:
+                player.all_in = True
+                out_mask |= bit
 
         return pot
 
-    def _determine_winners(self, players: List[_RoundPlayer]) -> List[_RoundPlayer]:
-        if not players:
-            return []
-        contenders = [player for player in players if not player.folded]
-        if not contenders:
-            return []
-        best = contenders[0]
-        winners = [best]
-        for player in contenders[1:]:
-            comparison = compare_hands(player.hand_after, winners[0].hand_after)
-            if comparison > 0:
-                winners = [player]
-            elif comparison == 0:
-                winners.append(player)
-        return winners
-
     def _obtain_discard(
         self,
         agent: Any,
@@ -471,21 +539,12 @@ class FiveCardDrawEngine:
             decision = DiscardDecision([])
         indices = list(decision.discard_indices)
         indices.sort()
-        if not self._validate_discard(indices, len(hand), rules):
+        if not _validate_discard(indices, len(hand), rules):
             decision = _conservative_fallback(hand, rules)
         else:
             decision.discard_indices = indices
         return decision
 
-    def _validate_discard(self, indices: List[int], hand_size: int, rules: DecisionRules) -> bool:
-        if any(idx < 0 or idx >= hand_size for idx in indices):
-            return False
-        if len(set(indices)) != len(indices):
-            return False
-        if len(indices) > rules.max_discards:
-            return False
-        return True
-
     def _obtain_bet(
         self,
         agent: Any,
@@ -504,35 +563,30 @@ class FiveCardDrawEngine:
         return decision
 
     def _default_bet_decision(self, context: BettingContext) -> BetDecision:
-        actions = set(context.available_actions)
-        if BettingAction.CHECK in actions:
-            return BetDecision(BettingAction.CHECK)
-        if BettingAction.CALL in actions:
-            return BetDecision(BettingAction.CALL, min(context.to_call, context.stack))
-        if BettingAction.BET in actions:
-            return BetDecision(BettingAction.BET, min(context.min_bet, context.stack))
-        if BettingAction.RAISE in actions:
-            return BetDecision(
-                BettingAction.RAISE,
-                min(context.to_call + context.min_raise, context.stack),
-            )
-        return BetDecision(BettingAction.FOLD)
+        actions = context.available_actions
+        action = _DEFAULT_ACTIONS.get(actions)
+        if action is None:
+            action = _default_action(actions)
+        return BetDecision(action, _DEFAULT_AMOUNT[action](context))
 
     def _normalize_bet(self, decision: BetDecision, context: BettingContext) -> BetDecision:
         if decision.action not in context.available_actions:
             return self._default_bet_decision(context)
         action = decision.action
+        if type(action) is not BettingAction:
+            # Plain strings pass the membership test; coerce so callers can use ``is``.
+            action = BettingAction(action)
         amount = max(decision.amount, 0)
-        if action in {BettingAction.CHECK, BettingAction.FOLD}:
+        if action in _NO_AMOUNT_ACTIONS:
             return BetDecision(action, 0, decision.rationale)
-        if action == BettingAction.CALL:
+        if action is BettingAction.CALL:
             amount = min(max(amount, context.to_call), context.stack)
             return BetDecision(action, amount, decision.rationale)
-        if action == BettingAction.BET:
+        if action is BettingAction.BET:
             minimum = min(context.stack, max(context.min_bet, 1))
             amount = min(max(amount, minimum), context.stack)
             return BetDecision(action, amount, decision.rationale)
-        if action == BettingAction.RAISE:
+        if action is BettingAction.RAISE:
             minimum_total = context.to_call + max(context.min_raise, 1)
             amount = min(max(amount, minimum_total), context.stack)
             return BetDecision(action, amount, decision.rationale)
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass, field
-from typing import Callable, Dict, Iterable, List, Optional, Sequence
-
-from deck import Card, Deck
-from engine import BettingEvent, GameResult, PlayerResult, PlayerSeat
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from deck import Deck
+from engine import (
+    GameResult,
+    PlayerResult,
+    PlayerSeat,
+    _apply_discard,
+    _available_actions,
+    _conservative_fallback,
+    _determine_winners,
+    _pay_winners,
+    _RoundPlayer,
+    _validate_discard,
+)
 from game_types import (
     BetDecision,
     BettingAction,
@@ -16,115 +27,32 @@ from game_types import (
     DecisionRules,
     DiscardDecision,
 )
-from hand_eval import HandEvaluation, compare_hands, evaluate_hand
-
+from hand_eval import evaluate_hand
 
-def _rank_value(rank: str) -> int:
-    order = "23456789TJQKA"
-    return order.index(rank) + 2
 
-
-def _conservative_fallback(hand: List[Card], rules: DecisionRules) -> DiscardDecision:
-    max_allowed = min(rules.max_discards, 3)
-    if max_allowed <= 0:
-        return DiscardDecision([])
-    values = [_rank_value(card.rank) for card in hand]
-    counts: Dict[int, int] = {}
-    for value in values:
-        counts[value] = counts.get(value, 0) + 1
-    keep_indices = {
-        index for index, value in enumerate(values) if counts[value] >= 2
-    }
-    discard_candidates = [
-        (values[index], index) for index in range(len(hand)) if index not in keep_indices
-    ]
-    discard_candidates.sort()
-    chosen = [index for _, index in discard_candidates[:max_allowed]]
-    return DiscardDecision(sorted(chosen), rationale="Fallback: keep made pairs")
-
-
-def _validate_discard(indices: Iterable[int], hand_size: int, rules: DecisionRules) -> bool:
-    seen = set()
-    count = 0
-    for index in indices:
-        if not isinstance(index, int):
-            return False
-        if index < 0 or index >= hand_size:
-            return False
-        if index in seen:
-            return False
-        seen.add(index)
-        count += 1
-    return count <= rules.max_discards
-
-
-def _apply_discard(hand: List[Card], discard_indices: Iterable[int], deck: Deck) -> List[Card]:
-    discard_set = set(discard_indices)
-    keep = [card for idx, card in enumerate(hand) if idx not in discard_set]
-    drawn = deck.draw(len(discard_set)) if discard_set else []
-    return keep + drawn
-
-
-def _available_actions(
-    player: "_RoundPlayer",
-    to_call: int,
-    rules: DecisionRules,
-    raises: int,
-) -> List[BettingAction]:
-    if player.folded:
-        return []
-    actions: List[BettingAction] = []
-    if to_call <= 0:
-        actions.append(BettingAction.CHECK)
-        if player.seat.stack > 0 and rules.min_bet > 0:
-            actions.append(BettingAction.BET)
-    else:
-        if player.seat.stack > 0:
-            actions.append(BettingAction.CALL)
-            if (
-                player.seat.stack > to_call
-                and player.seat.stack - to_call >= rules.min_bet
-                and raises < rules.max_raises
-            ):
-                actions.append(BettingAction.RAISE)
-        actions.append(BettingAction.FOLD)
-        if player.seat.stack <= to_call:
-            actions = [action for action in actions if action != BettingAction.RAISE]
-    if not actions and to_call <= 0:
-        actions.append(BettingAction.CHECK)
-    if BettingAction.CALL not in actions and to_call > 0 and player.seat.stack > 0:
-        actions.append(BettingAction.CALL)
-    if BettingAction.FOLD not in actions and to_call > 0:
-        actions.append(BettingAction.FOLD)
-    return actions
-
-
-@dataclass
+@dataclass(slots=True)
 class InteractiveEvent:
     """Represents a single event emitted from an interactive hand."""
 
     type: str
     payload: Dict[str, object]
 
-
-@dataclass
-class _RoundPlayer:
-    seat: PlayerSeat
-    hand: List[Card]
-    starting_stack: int
-    current_bet: int = 0
-    committed: int = 0
-    folded: bool = False
-    all_in: bool = False
-    betting_history: List[BettingEvent] = field(default_factory=list)
-    discard_decision: DiscardDecision = field(default_factory=DiscardDecision)
-    hand_after: List[Card] = field(default_factory=list)
-    initial_eval: Optional[HandEvaluation] = None
-    final_eval: Optional[HandEvaluation] = None
-
-    @property
-    def player_id(self) -> int:
-        return self.seat.player_id
+    @classmethod
+    def bet(
+        cls, player_id: int, action: BettingAction, amount: int, pot: int, stack: int
+    ) -> "InteractiveEvent":
+        """Build the ``bet`` event emitted for every betting action."""
+
+        return cls(
+            "bet",
+            {
+                "player_id": player_id,
+                "action": action.value,
+                "amount": amount,
+                "pot": pot,
+                "stack": stack,
+            },
+        )
 
 
 class InteractiveHand:
@@ -140,13 +68,16 @@ class InteractiveHand:
         engine: "InteractiveFiveCardDrawEngine",
         game_id: int,
         seats: Sequence[PlayerSeat],
+        *,
+        record_events: bool = True,
     ) -> None:
         self._engine = engine
+        # Event payloads are not built at all when nobody will read ``events``.
+        self._record_events = record_events
         self.game_id = game_id
         self.rules = engine.rules
         self.rng = engine.rng
-        self.deck = Deck(rng=self.rng)
-        self.deck.shuffle()
+        self.deck = engine._acquire_deck(self)
         hands = self.deck.deal(len(seats), 5)
         self.players: List[_RoundPlayer] = []
         self.pot = 0
@@ -155,10 +86,10 @@ class InteractiveHand:
         for seat, hand in zip(seats, hands):
             player = _RoundPlayer(
                 seat=seat,
-                hand=list(hand),
-                hand_after=list(hand),
+                hand=hand,
+                hand_after=hand,
                 starting_stack=seat.stack,
-                initial_eval=evaluate_hand(list(hand)),
+                initial_eval=evaluate_hand(hand),
             )
             if self.rules.ante > 0 and seat.stack > 0:
                 ante = min(self.rules.ante, seat.stack)
@@ -166,14 +97,8 @@ class InteractiveHand:
                 player.current_bet += ante
                 player.committed += ante
                 self.pot += ante
-                player.betting_history.append(
-                    BettingEvent(
-                        action=BettingAction.BET,
-                        amount=ante,
-                        rationale="Ante",
-                        pot_after=self.pot,
-                        stack_after=seat.stack,
-                    )
+                player._history.append(
+                    (BettingAction.BET, ante, "Ante", self.pot, seat.stack)
                 )
                 if seat.stack == 0:
                     player.all_in = True
@@ -182,29 +107,39 @@ class InteractiveHand:
         self.phase = self.PHASE_BETTING
         self._current_bet = max((p.current_bet for p in self.players), default=0)
         self._raises = 0
-        self._players_needed = {
-            player.player_id
-            for player in self.players
-            if not player.folded and not player.all_in
+        # Betting state is kept as bitmasks over seat positions: ``_live_mask`` marks
+        # seats that can still act (neither folded nor all-in) and ``_players_needed``
+        # the live seats still owed an action, so it is always a subset of the former.
+        self._seat_bits: Dict[int, int] = {
+            player.player_id: 1 << position for position, player in enumerate(self.players)
         }
+        self._active_count = len(self.players)
+        self._live_mask = 0
+        for position, player in enumerate(self.players):
+            if not player.folded and not player.all_in:
+                self._live_mask |= 1 << position
+        self._players_needed = self._live_mask
         self._turn_index = 0
-        self.events.append(
-            InteractiveEvent(
-                "hand_start",
-                {
-                    "game_id": game_id,
-                    "players": [
-                        {
-                            "player_id": player.player_id,
-                            "hand": [str(card) for card in player.hand],
-                            "stack": player.seat.stack,
-                        }
-                        for player in self.players
-                    ],
-                    "pot": self.pot,
-                },
+        self._draw_queue: List[_RoundPlayer] = []
+        self._draw_index = 0
+        if record_events:
+            self.events.append(
+                InteractiveEvent(
+                    "hand_start",
+                    {
+                        "game_id": game_id,
+                        "players": [
+                            {
+                                "player_id": player.player_id,
+                                "hand": [str(card) for card in player.hand],
+                                "stack": player.seat.stack,
+                            }
+                            for player in self.players
+                        ],
+                        "pot": self.pot,
+                    },
+                )
             )
-        )
 
     # ------------------------------------------------------------------
     # Betting helpers
@@ -213,34 +148,30 @@ class InteractiveHand:
     def current_actor(self) -> Optional[_RoundPlayer]:
         if self.phase != self.PHASE_BETTING:
             return None
-        total = len(self.players)
-        for _ in range(total):
-            player = self.players[self._turn_index % total]
-            self._turn_index += 1
-            if player.folded or player.all_in:
-                self._players_needed.discard(player.player_id)
-                continue
-            if player.player_id not in self._players_needed:
-                continue
-            return player
-        return None
+        position = self._next_needed_position()
+        if position is None:
+            return None
+        self._turn_index = position + 1
+        return self.players[position]
 
     def peek_current_actor(self) -> Optional[_RoundPlayer]:
         if self.phase != self.PHASE_BETTING:
             return None
+        position = self._next_needed_position()
+        return None if position is None else self.players[position]
+
+    def _next_needed_position(self) -> Optional[int]:
+        """Return the first seat at or after the turn index still owed an action."""
+
+        needed = self._players_needed
+        if not needed:
+            return None
         total = len(self.players)
-        idx = self._turn_index
-        needed = set(self._players_needed)
-        for _ in range(total):
-            player = self.players[idx % total]
-            idx += 1
-            if player.folded or player.all_in:
-                needed.discard(player.player_id)
-                continue
-            if player.player_id not in needed:
-                continue
-            return player
-        return None
+        start = self._turn_index % total
+        # Rotate the mask so ``start`` becomes bit 0; the lowest set bit is the next seat.
+        rotated = (needed >> start | needed << (total - start)) & ((1 << total) - 1)
+        offset = (rotated & -rotated).bit_length() - 1
+        return (start + offset) % total
 
     def betting_context(self, player: _RoundPlayer) -> BettingContext:
         to_call = max(0, self._current_bet - player.current_bet)
@@ -256,143 +187,94 @@ class InteractiveHand:
             min_raise=self.rules.min_bet,
             stack=player.seat.stack,
             committed=player.current_bet,
-            available_actions=tuple(available),
+            available_actions=available,
             rng=self.rng,
         )
 
     def apply_bet_decision(
-        self, player: _RoundPlayer, decision: BetDecision
+        self,
+        player: _RoundPlayer,
+        decision: BetDecision,
+        *,
+        context: Optional[BettingContext] = None,
     ) -> InteractiveEvent:
-        context = self.betting_context(player)
+        # Callers that already built this turn's context can hand it back in.
+        if context is None:
+            context = self.betting_context(player)
         if decision.action not in context.available_actions:
             raise ValueError("Illegal betting action")
-        action = decision.action
+        action = BettingAction(decision.action)
         amount = max(decision.amount or 0, 0)
-        to_call = context.to_call
-        if action == BettingAction.CHECK:
-            self._players_needed.discard(player.player_id)
-            event = BettingEvent(action, 0, decision.rationale, self.pot, player.seat.stack)
-            player.betting_history.append(event)
-            self.events.append(
-                InteractiveEvent(
-                    "bet",
-                    {
-                        "player_id": player.player_id,
-                        "action": action.value,
-                        "amount": 0,
-                        "pot": self.pot,
-                        "stack": player.seat.stack,
-                    },
-                )
-            )
-            return InteractiveEvent("bet_round", {"continue": True})
-
-        if action == BettingAction.FOLD:
-            player.folded = True
-            self._players_needed.discard(player.player_id)
-            player.betting_history.append(
-                BettingEvent(action, 0, decision.rationale, self.pot, player.seat.stack)
-            )
-            self.events.append(
-                InteractiveEvent(
-                    "bet",
-                    {
-                        "player_id": player.player_id,
-                        "action": action.value,
-                        "amount": 0,
-                        "pot": self.pot,
-                        "stack": player.seat.stack,
-                    },
-                )
-            )
-            return InteractiveEvent("bet_round", {"continue": True})
-
-        if action == BettingAction.BET:
-            pay = min(max(amount, self.rules.min_bet), player.seat.stack)
-            if pay <= 0:
-                pay = min(player.seat.stack, self.rules.min_bet)
-            player.seat.stack -= pay
-            player.current_bet += pay
-            player.committed += pay
-            self.pot += pay
-            self._current_bet = player.current_bet
-            self._raises = 1
-            player.betting_history.append(
-                BettingEvent(action, pay, decision.rationale, self.pot, player.seat.stack)
-            )
-            self._reset_players_needed(exclude=player.player_id)
-            if player.seat.stack == 0:
-                player.all_in = True
-            self.events.append(
-                InteractiveEvent(
-                    "bet",
-                    {
-                        "player_id": player.player_id,
-                        "action": action.value,
-                        "amount": pay,
-                        "pot": self.pot,
-                        "stack": player.seat.stack,
-                    },
-                )
-            )
-            return InteractiveEvent("bet_round", {"continue": True})
-
-        if action == BettingAction.CALL:
-            pay = min(max(amount, to_call), player.seat.stack)
-            player.seat.stack -= pay
-            player.current_bet += pay
-            player.committed += pay
-            self.pot += pay
-            if player.current_bet < self._current_bet:
-                player.all_in = True
-            player.betting_history.append(
-                BettingEvent(action, pay, decision.rationale, self.pot, player.seat.stack)
-            )
-            self._players_needed.discard(player.player_id)
-            self.events.append(
-                InteractiveEvent(
-                    "bet",
-                    {
-                        "player_id": player.player_id,
-                        "action": action.value,
-                        "amount": pay,
-                        "pot": self.pot,
-                        "stack": player.seat.stack,
-                    },
-                )
-            )
-            return InteractiveEvent("bet_round", {"continue": True})
-
-        if action == BettingAction.RAISE:
-            minimum_total = to_call + max(self.rules.min_bet, self.rules.min_bet)
-            pay = min(max(amount, minimum_total), player.seat.stack)
-            player.seat.stack -= pay
-            player.current_bet += pay
-            player.committed += pay
-            self.pot += pay
-            self._current_bet = player.current_bet
-            self._raises += 1
-            player.betting_history.append(
-                BettingEvent(action, pay, decision.rationale, self.pot, player.seat.stack)
-            )
-            self._reset_players_needed(exclude=player.player_id)
-            if player.seat.stack == 0:
-                player.all_in = True
+        pay = self._ACTION_HANDLERS[action](self, player, amount, context.to_call)
+        stack = player.seat.stack
+        player._history.append((action, pay, decision.rationale, self.pot, stack))
+        if self._record_events:
             self.events.append(
-                InteractiveEvent(
-                    "bet",
-                    {
-                        "player_id": player.player_id,
-                        "action": action.value,
-                        "amount": pay,
-                        "pot": self.pot,
-                        "stack": player.seat.stack,
-                    },
-                )
+                InteractiveEvent.bet(player.player_id, action, pay, self.pot, stack)
             )
-            return InteractiveEvent("bet_round", {"continue": True})
-
-        raise ValueError(f"Unsupported action: {action}")
+        return InteractiveEvent("bet_round", {"continue": True})
+
+    # Action handlers apply one betting action and return the chips it moved.
+
+    def _do_check(self, player: _RoundPlayer, amount: int, to_call: int) -> int:
+        self._players_needed &= ~self._seat_bits[player.player_id]
+        return 0
+
+    def _do_fold(self, player: _RoundPlayer, amount: int, to_call: int) -> int:
+        player.folded = True
+        self._active_count -= 1
+        bit = self._seat_bits[player.player_id]
+        self._live_mask &= ~bit
+        self._players_needed &= ~bit
+        return 0
+
+    def _do_call(self, player: _RoundPlayer, amount: int, to_call: int) -> int:
+        pay = min(max(amount, to_call), player.seat.stack)
+        self._move_chips(player, pay)
+        bit = self._seat_bits[player.player_id]
+        if player.current_bet < self._current_bet:
+            player.all_in = True
+            self._live_mask &= ~bit
+        self._players_needed &= ~bit
+        return pay
+
+    def _do_bet(self, player: _RoundPlayer, amount: int, to_call: int) -> int:
+        pay = min(max(amount, self.rules.min_bet), player.seat.stack)
+        if pay <= 0:
+            pay = min(player.seat.stack, self.rules.min_bet)
+        self._raises = 1
+        self._open_action(player, pay)
+        return pay
+
+    def _do_raise(self, player: _RoundPlayer, amount: int, to_call: int) -> int:
+        pay = min(max(amount, to_call + self.rules.min_bet), player.seat.stack)
+        self._raises += 1
+        self._open_action(player, pay)
+        return pay
+
+    def _open_action(self, player: _RoundPlayer, pay: int) -> None:
+        """Apply a bet or raise: everyone else still live must act again."""
+
+        self._move_chips(player, pay)
+        self._current_bet = player.current_bet
+        self._reset_players_needed(exclude=player.player_id)
+        if player.seat.stack == 0:
+            player.all_in = True
+            self._live_mask &= ~self._seat_bits[player.player_id]
+
+    def _move_chips(self, player: _RoundPlayer, pay: int) -> None:
+        player.seat.stack -= pay
+        player.current_bet += pay
+        player.committed += pay
+        self.pot += pay
+
+    _ACTION_HANDLERS: Dict[BettingAction, Callable[..., int]] = {
+        BettingAction.CHECK: _do_check,
+        BettingAction.FOLD: _do_fold,
+        BettingAction.CALL: _do_call,
+        BettingAction.BET: _do_bet,
+        BettingAction.RAISE: _do_raise,
+    }
 
     def progress_after_betting(self) -> None:
         if self.phase != self.PHASE_BETTING:
@@ -405,17 +287,10 @@ class InteractiveHand:
             self.phase = self.PHASE_SHOWDOWN
 
     def _reset_players_needed(self, exclude: int) -> None:
-        self._players_needed = {
-            player.player_id
-            for player in self.players
-            if not player.folded and not player.all_in and player.player_id != exclude
-        }
+        self._players_needed = self._live_mask & ~self._seat_bits[exclude]
 
     def betting_complete(self) -> bool:
-        active = [player for player in self.players if not player.folded]
-        if len(active) <= 1:
-            return True
-        return not self._players_needed
+        return self._active_count <= 1 or not self._players_needed
 
     # ------------------------------------------------------------------
     # Draw helpers
@@ -436,8 +311,6 @@ class InteractiveHand:
     def peek_next_discard(self) -> Optional[_RoundPlayer]:
         if self.phase != self.PHASE_DRAW:
             return None
-        if not hasattr(self, "_draw_queue"):
-            return None
         if self._draw_index >= len(self._draw_queue):
             return None
         return self._draw_queue[self._draw_index]
@@ -447,19 +320,25 @@ class InteractiveHand:
             raise ValueError("Invalid discard decision")
         if not _validate_discard(decision.discard_indices, len(player.hand_after), self.rules):
             decision = _conservative_fallback(player.hand_after, self.rules)
+        self._apply_validated_discard(player, decision)
+
+    def _apply_validated_discard(self, player: _RoundPlayer, decision: DiscardDecision) -> None:
+        """Apply a discard that has already been validated or replaced by the fallback."""
+
         player.discard_decision = decision
+        # Evaluation is deferred to showdown, where hands that survive are scored together.
         player.hand_after = _apply_discard(player.hand_after, decision.discard_indices, self.deck)
-        player.final_eval = evaluate_hand(player.hand_after)
-        self.events.append(
-            InteractiveEvent(
-                "discard",
-                {
-                    "player_id": player.player_id,
-                    "discard_indices": list(decision.discard_indices),
-                    "hand_after": [str(card) for card in player.hand_after],
-                },
+        if self._record_events:
+            self.events.append(
+                InteractiveEvent(
+                    "discard",
+                    {
+                        "player_id": player.player_id,
+                        "discard_indices": list(decision.discard_indices),
+                        "hand_after": [str(card) for card in player.hand_after],
+                    },
+                )
             )
-        )
         if self.peek_next_discard() is None:
             self.phase = self.PHASE_SHOWDOWN
 
@@ -471,18 +350,9 @@ class InteractiveHand:
         active_players = [player for player in self.players if not player.folded]
         if len(active_players) == 1:
             winner = active_players[0]
-            winner.final_eval = winner.final_eval or winner.initial_eval
-            winner.seat.stack += self.pot
-            winner.betting_history.append(
-                BettingEvent(
-                    action=BettingAction.CALL,
-                    amount=self.pot,
-                    rationale="Payout",
-                    pot_after=0,
-                    stack_after=winner.seat.stack,
-                )
-            )
-            results = self._build_player_results([winner])
+            self._evaluate_finals(active_players)
+            _pay_winners(active_players, self.pot)
+            results = self._build_player_results()
             bankrolls = {player.player_id: player.seat.stack for player in self.players}
             self.phase = self.PHASE_COMPLETE
             return GameResult(
@@ -493,26 +363,10 @@ class InteractiveHand:
                 bankrolls=bankrolls,
             )
 
-        for player in active_players:
-            player.final_eval = player.final_eval or evaluate_hand(player.hand_after)
-
-        winners = self._determine_winners(active_players)
-        share, remainder = divmod(self.pot, len(winners))
-        remaining = self.pot
-        for idx, winner in enumerate(winners):
-            payout = share + (1 if idx < remainder else 0)
-            winner.seat.stack += payout
-            remaining -= payout
-            winner.betting_history.append(
-                BettingEvent(
-                    action=BettingAction.CALL,
-                    amount=payout,
-                    rationale="Payout",
-                    pot_after=max(remaining, 0),
-                    stack_after=winner.seat.stack,
-                )
-            )
-        results = self._build_player_results(winners)
+        self._evaluate_finals(active_players)
+        winners = _determine_winners(active_players)
+        _pay_winners(winners, self.pot)
+        results = self._build_player_results()
         bankrolls = {player.player_id: player.seat.stack for player in self.players}
         self.phase = self.PHASE_COMPLETE
         return GameResult(
@@ -523,42 +377,18 @@ class InteractiveHand:
             bankrolls=bankrolls,
         )
 
-    def _determine_winners(self, players: List[_RoundPlayer]) -> List[_RoundPlayer]:
-        if not players:
-            return []
-        best = players[0]
-        winners = [best]
-        for player in players[1:]:
-            comparison = compare_hands(player.hand_after, winners[0].hand_after)
-            if comparison > 0:
-                winners = [player]
-            elif comparison == 0:
-                winners.append(player)
-        return winners
-
-    def _build_player_results(self, winners: List[_RoundPlayer]) -> List[PlayerResult]:
-        winner_ids = {player.player_id for player in winners}
-        results: List[PlayerResult] = []
-        for player in self.players:
-            final_eval = player.final_eval if not player.folded else None
-            stack_change = player.seat.stack - player.starting_stack
-            results.append(
-                PlayerResult(
-                    player_id=player.player_id,
-                    name=player.seat.name,
-                    hand_before=player.hand,
-                    hand_after=player.hand_after,
-                    decision=player.discard_decision,
-                    initial_eval=player.initial_eval,
-                    final_eval=final_eval,
-                    folded=player.folded,
-                    initial_stack=player.starting_stack,
-                    final_stack=player.seat.stack,
-                    stack_change=stack_change,
-                    betting_history=player.betting_history,
-                )
-            )
-        return results
+    @staticmethod
+    def _evaluate_finals(players: List[_RoundPlayer]) -> None:
+        for player in players:
+            if player.final_eval is None:
+                # A stand-pat hand is still the dealt list, so its initial evaluation holds.
+                if player.hand_after is player.hand:
+                    player.final_eval = player.initial_eval
+                else:
+                    player.final_eval = evaluate_hand(player.hand_after)
+
+    def _build_player_results(self) -> List[PlayerResult]:
+        return [player.to_result() for player in self.players]
 
     # ------------------------------------------------------------------
     # Automation helpers
@@ -569,27 +399,31 @@ class InteractiveHand:
             actor = self.current_actor()
             if actor is None:
                 break
-            decision = self._auto_bet(actor)
-            self.apply_bet_decision(actor, decision)
+            context = self.betting_context(actor)
+            decision = self._auto_bet(actor, context)
+            self.apply_bet_decision(actor, decision, context=context)
         if self.phase == self.PHASE_BETTING:
             self.progress_after_betting()
         if self.phase == self.PHASE_DRAW:
             self.begin_draw_phase()
             player = self.next_to_discard()
             while player is not None:
-                decision = self._auto_discard(player)
-                self.apply_discard(player, decision)
+                # _auto_discard already validated the decision.
+                self._apply_validated_discard(player, self._auto_discard(player))
                 player = self.next_to_discard()
             self.phase = self.PHASE_SHOWDOWN
         if self.phase == self.PHASE_SHOWDOWN:
             return self.showdown()
         return self.showdown()
 
-    def _auto_bet(self, player: _RoundPlayer) -> BetDecision:
+    def _auto_bet(
+        self, player: _RoundPlayer, context: Optional[BettingContext] = None
+    ) -> BetDecision:
         agent = player.seat.agent
         if agent is None:
             raise RuntimeError("Cannot auto-play a seat without an agent")
-        context = self.betting_context(player)
+        if context is None:
+            context = self.betting_context(player)
         decision = agent.decide_bet(player.hand_after, context)
         if not isinstance(decision, BetDecision):
             return BetDecision(BettingAction.CHECK, 0, "Auto fallback: check")
@@ -627,8 +461,7 @@ class InteractiveHand:
         return self.peek_next_discard() is not None
 
     def _should_continue_to_draw(self) -> bool:
-        active_players = [player for player in self.players if not player.folded]
-        return len(active_players) > 1
+        return self._active_count > 1
 
 
 class InteractiveFiveCardDrawEngine:
@@ -646,10 +479,29 @@ class InteractiveFiveCardDrawEngine:
         self.seats = list(seats)
         self.rules = rules or DecisionRules()
         self.rng = rng or random.Random()
+        self._deck = Deck(rng=self.rng)
+        self._deck_owner: Optional[InteractiveHand] = None
+
+    def _acquire_deck(self, hand: InteractiveHand) -> Deck:
+        """Return a freshly shuffled deck for ``hand``, reusing the engine's own.
+
+        A hand abandoned mid-play may still draw from its deck, so if the previous
+        owner has not completed it keeps that deck and the engine starts a new one.
+        """
+
+        owner = self._deck_owner
+        if owner is not None and owner.phase != InteractiveHand.PHASE_COMPLETE:
+            self._deck = Deck(rng=self.rng)
+        self._deck_owner = hand
+        deck = self._deck
+        deck.reset()
+        deck.shuffle()
+        return deck
 
-    def start_hand(self, game_id: int) -> InteractiveHand:
-        return InteractiveHand(self, game_id, self.seats)
+    def start_hand(self, game_id: int, *, record_events: bool = True) -> InteractiveHand:
+        return InteractiveHand(self, game_id, self.seats, record_events=record_events)
 
     def autoplay_hand(self, game_id: int) -> GameResult:
-        hand = self.start_hand(game_id)
+        # Nobody reads the event stream of a fully automated hand.
+        hand = self.start_hand(game_id, record_events=False)
         return hand.auto_play()
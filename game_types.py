@@ -5,7 +5,7 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Sequence, Tuple
+from typing import Optional, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -68,7 +68,7 @@ class BetDecision:
 class DiscardDecision:
     """The result of an agent's draw decision."""
 
-    discard_indices: List[int] = field(default_factory=list)
+    discard_indices: Sequence[int] = field(default_factory=list)
     rationale: Optional[str] = None
 
 
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from dataclasses import dataclass, field
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, Final, Iterable, List, Sequence, Tuple
 
 from deck import Card, RANKS
 
 
-RANK_VALUE = {rank: index for index, rank in enumerate(RANKS, start=2)}
-HAND_RANKS: Sequence[str] = (
+RANK_VALUE: Final[Dict[str, int]] = {rank: index for index, rank in enumerate(RANKS, start=2)}
+HAND_RANKS: Final[Sequence[str]] = (
     "High Card",
     "One Pair",
     "Two Pair",
@@ -25,43 +25,82 @@ HAND_RANKS: Sequence[str] = (
 
 @dataclass(frozen=True)
 class HandEvaluation:
-    """Represents the evaluated strength of a five-card hand."""
+    """Represents the evaluated strength of a five-card hand.
+
+    ``score`` packs ``rank_id`` above up to five 4-bit tiebreak ranks, so a
+    stronger hand always has the larger score.
+    """
 
     rank_id: int
     tiebreak: Tuple[int, ...]
+    score: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        score = self.rank_id << 20
+        for position, value in enumerate(self.tiebreak):
+            score |= value << (16 - 4 * position)
+        object.__setattr__(self, "score", score)
 
     @property
     def rank_name(self) -> str:
         return HAND_RANKS[self.rank_id]
 
 
+# Rank value indexed by ``Card.code``; a tuple index beats hashing ``card.rank``.
+_VALUE_BY_CODE: Final[Tuple[int, ...]] = tuple((code >> 2) + 2 for code in range(52))
+
+
 def _sorted_ranks(cards: Sequence[Card]) -> List[int]:
-    values = sorted((RANK_VALUE[card.rank] for card in cards), reverse=True)
+    values = [_VALUE_BY_CODE[card.code] for card in cards]
+    values.sort(reverse=True)
     return values
 
 
+# Rank bitmask (bit ``value - 2``) of each straight, mapped to its high card.
+_STRAIGHT_HIGH_BY_MASK: Final[Dict[int, int]] = {
+    0b11111 << (high - 6): high for high in range(6, 15)
+}
+_STRAIGHT_HIGH_BY_MASK[0b1000000001111] = 5  # Wheel straight A-2-3-4-5
+
+
 def _is_straight(values: Sequence[int]) -> Tuple[bool, int]:
-    unique = sorted(set(values))
-    if len(unique) != 5:
+    mask = 0
+    for value in values:
+        mask |= 1 << (value - 2)
+    if mask.bit_count() != 5:
         return False, 0
-    high = max(unique)
-    low = min(unique)
-    if high - low == 4:
-        return True, high
-    # Wheel straight A-2-3-4-5
-    if set(unique) == {14, 5, 4, 3, 2}:
-        return True, 5
-    return False, 0
+    high = _STRAIGHT_HIGH_BY_MASK.get(mask, 0)
+    return bool(high), high
 
 
 def evaluate_hand(cards: Sequence[Card]) -> HandEvaluation:
     if len(cards) != 5:
         raise ValueError("Five-card evaluation requires exactly 5 cards")
-    values = _sorted_ranks(cards)
-    counts = Counter(values)
-    by_count = sorted(counts.items(), key=lambda kv: (-kv[1], -kv[0]))
-    suits = {card.suit for card in cards}
-    is_flush = len(suits) == 1
+    c1, c2, c3, c4, c5 = [_CACTUS_KEV[card.code] for card in cards]
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        evaluation = _FLUSH_LOOKUP.get((c1 | c2 | c3 | c4 | c5) >> 16)
+    else:
+        evaluation = _UNSUITED_LOOKUP.get(
+            (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+        )
+    if evaluation is None:
+        # Only reachable with repeated cards, which no table entry describes.
+        evaluation = _classify(_sorted_ranks(cards), len({card.suit for card in cards}) == 1)
+    return evaluation
+
+
+def _classify(values: List[int], is_flush: bool) -> HandEvaluation:
+    histogram = [0] * 15
+    for value in values:
+        histogram[value] += 1
+    # Walking ranks high to low and bucketing by multiplicity yields the
+    # ``(rank, count)`` pairs already ordered by count, then rank.
+    buckets: List[List[int]] = [[], [], [], [], [], []]
+    for rank in range(14, 1, -1):
+        count = histogram[rank]
+        if count:
+            buckets[count].append(rank)
+    by_count = [(rank, count) for count in range(5, 0, -1) for rank in buckets[count]]
     is_straight, straight_high = _is_straight(values)
 
     if is_straight and is_flush:
@@ -101,14 +140,49 @@ def evaluate_hand(cards: Sequence[Card]) -> HandEvaluation:
     return HandEvaluation(0, tuple(values))
 
 
+# Cactus Kev card encoding, indexed by ``Card.code``: bit ``16 + rank`` marks the
+# rank, bits 12-15 the suit, bits 8-11 the rank index and the low byte that rank's
+# prime. A flush is detected by a shared suit bit; otherwise the product of the
+# five primes identifies the rank multiset uniquely.
+_PRIMES: Final[Tuple[int, ...]] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_CACTUS_KEV: Final[Tuple[int, ...]] = tuple(
+    1 << (16 + (code >> 2)) | 1 << (12 + (code & 3)) | (code >> 2) << 8 | _PRIMES[code >> 2]
+    for code in range(52)
+)
+
+
+def _build_lookups() -> Tuple[Dict[int, HandEvaluation], Dict[int, HandEvaluation]]:
+    """Evaluate every rank pattern once so lookups return shared evaluations."""
+
+    flush: Dict[int, HandEvaluation] = {}
+    unsuited: Dict[int, HandEvaluation] = {}
+    for ranks in combinations_with_replacement(range(13), 5):
+        if any(ranks.count(rank) > 4 for rank in ranks):
+            continue
+        values = sorted((rank + 2 for rank in ranks), reverse=True)
+        product = 1
+        for rank in ranks:
+            product *= _PRIMES[rank]
+        unsuited[product] = _classify(values, False)
+    for ranks in combinations(range(13), 5):
+        values = sorted((rank + 2 for rank in ranks), reverse=True)
+        flush[sum(1 << rank for rank in ranks)] = _classify(values, True)
+    return flush, unsuited
+
+
+_FLUSH_LOOKUP, _UNSUITED_LOOKUP = _build_lookups()
+
+
+def evaluate_scores(hands: Iterable[Sequence[Card]]) -> List[int]:
+    """Return the packed :attr:`HandEvaluation.score` for each five-card hand."""
+
+    return [evaluate_hand(cards).score for cards in hands]
+
+
 def compare_hands(hand_a: Sequence[Card], hand_b: Sequence[Card]) -> int:
-    eval_a = evaluate_hand(hand_a)
-    eval_b = evaluate_hand(hand_b)
-    if eval_a.rank_id != eval_b.rank_id:
-        return (eval_a.rank_id > eval_b.rank_id) - (eval_a.rank_id < eval_b.rank_id)
-    if eval_a.tiebreak != eval_b.tiebreak:
-        return (eval_a.tiebreak > eval_b.tiebreak) - (eval_a.tiebreak < eval_b.tiebreak)
-    return 0
+    score_a = evaluate_hand(hand_a).score
+    score_b = evaluate_hand(hand_b).score
+    return (score_a > score_b) - (score_a < score_b)
 
 
 def describe_hand(hand: Sequence[Card]) -> str:
@@ -120,8 +194,10 @@ def describe_hand(hand: Sequence[Card]) -> str:
 __all__ = [
     "HAND_RANKS",
     "HandEvaluation",
+    "RANK_VALUE",
     "compare_hands",
     "describe_hand",
     "evaluate_hand",
+    "evaluate_scores",
 ]
 
@@ -4,23 +4,49 @@ from __future__ import annotations
 
 import csv
 import json
-from typing import Optional
+from typing import Any, Optional
 
 from engine import GameResult
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+def _dumps(payload: Any) -> str:
+    if orjson is not None:
+        # Bankrolls are keyed by integer player id.
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _dumps_line(payload: Any) -> bytes:
+    """Encode one JSONL record, newline included, straight to UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 class GameLogger:
-    def __init__(self, path: str, *, fmt: str = "jsonl") -> None:
+    # Games are flushed in batches rather than one syscall per write.
+    FLUSH_EVERY = 1024
+
+    def __init__(self, path: str, *, fmt: str = "jsonl", raw: bool = False) -> None:
         self.path = path
         self.format = fmt.lower()
-        mode = "w"
-        newline = "\n" if self.format == "csv" else ""
-        self._handle = open(path, mode, encoding="utf-8", newline=newline)
+        # Raw logs carry card codes and rank ids instead of display strings.
+        self.raw = raw
         self._writer: Optional[csv.DictWriter] = None
+        self._pending = 0
         if self.format == "csv":
+            self._handle = open(path, "w", buffering=1 << 20, encoding="utf-8", newline="\n")
             fieldnames = ["game_id", "pot", "winners", "players"]
             self._writer = csv.DictWriter(self._handle, fieldnames=fieldnames)
             self._writer.writeheader()
+        else:
+            # JSONL records are encoded to bytes already; skip the text layer.
+            self._handle = open(path, "wb", buffering=1 << 20)
 
     def __enter__(self) -> "GameLogger":
         return self
@@ -30,13 +56,18 @@ class GameLogger:
 
     def log(self, result: GameResult) -> None:
         if self.format == "jsonl":
-            json.dump(result.to_dict(), self._handle, ensure_ascii=False)
-            self._handle.write("\n")
+            self._handle.write(_dumps_line(result.to_dict(raw=self.raw)))
         elif self.format == "csv":
             assert self._writer is not None
             self._writer.writerow(self._as_csv_row(result))
         else:  # pragma: no cover - defensive branch
             raise ValueError(f"Unsupported log format: {self.format}")
+        self._pending += 1
+        if self._pending >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        self._pending = 0
         self._handle.flush()
 
     def close(self) -> None:
@@ -44,13 +75,13 @@ class GameLogger:
             self._handle.close()
 
     def _as_csv_row(self, result: GameResult) -> dict:
-        player_payload = [player.to_dict() for player in result.players]
+        player_payload = [player.to_dict(raw=self.raw) for player in result.players]
         winners = ",".join(str(winner) for winner in result.winners) or "none"
         return {
             "game_id": result.game_id,
             "pot": result.pot,
             "winners": winners,
-            "players": json.dumps(player_payload, ensure_ascii=False),
+            "players": _dumps(player_payload),
         }
 
 
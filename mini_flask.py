@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 
 __all__ = ["Flask", "abort", "jsonify", "request"]
@@ -46,27 +47,40 @@ class Route:
         self.rule = rule
         self.func = func
         self.parts = [part for part in rule.strip("/").split("/") if part]
+        segments: List[str] = []
+        names: Set[str] = set()
+        for part in self.parts:
+            if part.startswith("<") and part.endswith(">"):
+                name = part[1:-1]
+                # Converters such as ``<int:id>`` are not supported; parameters
+                # become keyword arguments, so each must be a unique identifier.
+                if not name.isidentifier() or name in names:
+                    raise ValueError(f"Unsupported route parameter {part!r} in {rule!r}")
+                names.add(name)
+                segments.append(f"(?P<{name}>[^/]+)")
+            else:
+                segments.append(re.escape(part))
+        # Runs of slashes separate segments, as in the split-based matching
+        # this replaces, so "/games//1/" still matches "/games/<game_id>".
+        pattern = "/+".join(segments)
+        self._pattern = re.compile(f"/*{pattern}/*")
 
     def matches(self, method: str, path: str) -> Optional[Dict[str, str]]:
         if method.upper() != self.method:
             return None
-        parts = [part for part in path.strip("/").split("/") if part]
-        if len(parts) != len(self.parts):
-            return None
-        params: Dict[str, str] = {}
-        for route_part, path_part in zip(self.parts, parts):
-            if route_part.startswith("<") and route_part.endswith(">"):
-                key = route_part[1:-1]
-                params[key] = path_part
-            elif route_part != path_part:
-                return None
-        return params
+        match = self._pattern.fullmatch(path)
+        return match.groupdict() if match else None
+
+
+_PARAM_SEGMENT = "<param>"
 
 
 class Flask:
     def __init__(self, name: str) -> None:
         self.name = name
         self._routes: List[Route] = []
+        # method -> first path segment (or _PARAM_SEGMENT) -> routes in order.
+        self._routes_by_method: Dict[str, Dict[str, List[Route]]] = {}
 
     # Decorators -----------------------------------------------------
     def route(self, rule: str, methods: Optional[List[str]] = None) -> Callable:
@@ -74,7 +88,13 @@ class Flask:
 
         def decorator(func: Callable) -> Callable:
             for method in methods:
-                self._routes.append(Route(method, rule, func))
+                route = Route(method, rule, func)
+                self._routes.append(route)
+                first = route.parts[0] if route.parts else ""
+                if first.startswith("<") and first.endswith(">"):
+                    first = _PARAM_SEGMENT
+                buckets = self._routes_by_method.setdefault(route.method, {})
+                buckets.setdefault(first, []).append(route)
             return func
 
         return decorator
@@ -92,7 +112,10 @@ class Flask:
     # Internal request handling -------------------------------------
     def _handle_request(self, method: str, path: str, json_body: Any) -> Response:
         global request
-        for route in self._routes:
+        buckets = self._routes_by_method.get(method.upper(), {})
+        first = path.lstrip("/").partition("/")[0]
+        candidates = [*buckets.get(first, ()), *buckets.get(_PARAM_SEGMENT, ())]
+        for route in candidates:
             params = route.matches(method, path)
             if params is None:
                 continue
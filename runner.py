@@ -238,6 +238,12 @@ def build_parser() -> argparse.ArgumentParser:
         help="Maximum number of raises allowed in a betting round",
     )
     parser.add_argument("--cache-path", type=str, default=None, help="Path to LLM cache")
+    parser.add_argument(
+        "--cache-flush-interval",
+        type=float,
+        default=None,
+        help="Flush the LLM cache from a background thread every N seconds",
+    )
     parser.add_argument(
         "--config",
         type=str,
@@ -260,6 +266,7 @@ def instantiate_agents(
     model: str,
     temperature: float,
     cache_path: Optional[str],
+    cache_flush_interval: Optional[float] = None,
 ) -> List[PlayerSeat]:
     seats: List[PlayerSeat] = []
     for idx, (spec, bankroll) in enumerate(zip(specs, funds)):
@@ -270,6 +277,7 @@ def instantiate_agents(
                 model=model,
                 temperature=temperature,
                 cache_path=cache_path,
+                cache_flush_interval=cache_flush_interval,
                 bet_mode=spec.bet_mode,
             )
         seat = PlayerSeat(player_id=idx, name=spec.name, agent=agent, stack=bankroll)
@@ -314,6 +322,7 @@ def main(argv: Optional[List[str]] = None) -> None:
         model=args.model,
         temperature=args.temperature,
         cache_path=args.cache_path,
+        cache_flush_interval=args.cache_flush_interval,
     )
 
     print("✅ 已配置座位:")
@@ -338,11 +347,15 @@ def main(argv: Optional[List[str]] = None) -> None:
         max_raises=args.max_raises,
     )
 
+    # Bind the per-game calls once; the loop body runs ``--games`` times.
+    play_game = engine.play_game
+    log = logger.log if logger else None
+    update_stats = stats.update
     for game_id in range(1, args.games + 1):
-        result = engine.play_game(game_id, rules)
-        if logger:
-            logger.log(result)
-        stats.update(result)
+        result = play_game(game_id, rules)
+        if log is not None:
+            log(result)
+        update_stats(result)
 
     if logger:
         logger.close()
@@ -265,7 +265,7 @@ def apply_action(game_id: str):
             if amount < minimum_total:
                 abort(400, description=f"Raise must total at least {minimum_total}")
         decision = BetDecision(bet_action, amount, rationale)
-        hand.apply_bet_decision(player, decision)
+        hand.apply_bet_decision(player, decision, context=context)
         hand.progress_after_betting()
 
     elif action_type == "discard":
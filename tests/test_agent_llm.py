@@ -0,0 +1,452 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+from openai import BadRequestError, NotFoundError, RateLimitError
+
+from agent_llm import (
+    SYSTEM_PROMPT,
+    DecisionCache,
+    LLMAgent,
+    _canonicalize_hand,
+    _conservative_fallback,
+    _is_quota_error,
+    _retry_backoff,
+    get_cache,
+)
+from deck import hand_from_strs
+from game_types import (
+    BettingAction,
+    BettingContext,
+    DecisionContext,
+    DecisionRules,
+    DiscardDecision,
+)
+
+
+def test_decision_cache_round_trips_through_disk(tmp_path):
+    path = tmp_path / "cache" / "decisions.json"
+    cache = DecisionCache(str(path))
+    cache.set("model|5|Aa-Kb-Qc-7a-2b", DiscardDecision([3, 4], "Keep broadway ♠"))
+    cache.sync()
+
+    reloaded = DecisionCache(str(path))
+    decision = reloaded.get("model|5|Aa-Kb-Qc-7a-2b")
+    assert decision is not None
+    assert decision.discard_indices == (3, 4)
+    assert decision.rationale == "Keep broadway ♠"
+    assert reloaded.get("missing") is None
+
+
+def test_decision_cache_appends_only_new_entries(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    cache = DecisionCache(str(path))
+    cache.set("a", DiscardDecision([0]))
+    cache.sync()
+    cache.set("b", DiscardDecision([1, 2]))
+    cache.set("a", DiscardDecision([4]))
+    cache.sync()
+    cache.sync()
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    reloaded = DecisionCache(str(path))
+    assert reloaded.get("a").discard_indices == (4,)
+    assert reloaded.get("b").discard_indices == (1, 2)
+
+    reloaded.compact()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_decision_cache_upgrades_legacy_json_document(tmp_path):
+    path = tmp_path / "legacy.json"
+    path.write_text(
+        '{\n  "k1": {\n    "discard_indices": [0, 1],\n    "rationale": null\n  }\n}',
+        encoding="utf-8",
+    )
+    cache = DecisionCache(str(path))
+    assert cache.get("k1").discard_indices == (0, 1)
+
+    cache.set("k2", DiscardDecision([]))
+    cache.sync()
+    reloaded = DecisionCache(str(path))
+    assert reloaded.get("k1").discard_indices == (0, 1)
+    assert reloaded.get("k2").discard_indices == ()
+
+
+def test_canonical_hand_ignores_card_order():
+    first = _canonicalize_hand(hand_from_strs(["AS", "KH", "KS", "7D", "2C"]))
+    second = _canonicalize_hand(hand_from_strs(["2C", "7D", "KS", "AS", "KH"]))
+    assert first == second == "Aa-Ka-Kb-7c-2d"
+
+
+def test_conservative_fallback_keeps_pairs_and_drops_lowest_kickers():
+    hand = hand_from_strs(["9S", "KH", "9D", "2C", "5H"])
+    decision = _conservative_fallback(hand, DecisionRules(max_discards=2))
+    assert decision.discard_indices == [3, 4]
+
+    decision = _conservative_fallback(hand, DecisionRules(max_discards=5))
+    assert decision.discard_indices == [1, 3, 4]
+
+    assert _conservative_fallback(hand, DecisionRules(max_discards=0)).discard_indices == []
+
+
+class _FakeCompletions:
+    def __init__(self, contents):
+        self._contents = list(contents)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = self._contents.pop(0)
+        if isinstance(content, BaseException):
+            raise content
+        if not isinstance(content, str):
+            return content
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class _FakeClient:
+    def __init__(self, *contents):
+        self.chat = SimpleNamespace(completions=_FakeCompletions(contents))
+
+    @property
+    def calls(self):
+        return self.chat.completions.calls
+
+
+def _context():
+    return DecisionContext(game_id=1, player_id=0, rng=random.Random(0))
+
+
+def test_llm_discard_call_reuses_system_prompt_and_cache_key():
+    client = _FakeClient('{"discard_indices": [3, 4], "rationale": "draw"}')
+    agent = LLMAgent(model="test-model", client=client, prompt_cache_key=True)
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    decision = agent.decide_discard(hand, DecisionRules(), _context())
+
+    assert decision.discard_indices == [3, 4]
+    (call,) = client.calls
+    assert call["messages"][0] == {"role": "system", "content": SYSTEM_PROMPT}
+    assert call["extra_body"] == {"prompt_cache_key": "fivecard-draw-discard-test-model"}
+
+
+
+def test_prompt_cache_key_is_only_sent_when_enabled(monkeypatch):
+    monkeypatch.delenv("AZURE_OPENAI_PROMPT_CACHE_KEY", raising=False)
+    client = _FakeClient('{"discard_indices": [3, 4]}', '{"discard_indices": [3, 4]}')
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    LLMAgent(model="test-model", client=client).decide_discard(hand, DecisionRules())
+    monkeypatch.setenv("AZURE_OPENAI_PROMPT_CACHE_KEY", "1")
+    LLMAgent(model="other-model", client=client).decide_discard(hand, DecisionRules())
+
+    assert "extra_body" not in client.calls[0]
+    assert client.calls[1]["extra_body"] == {"prompt_cache_key": "fivecard-draw-discard-other-model"}
+
+class _FakeAsyncCompletions(_FakeCompletions):
+    async def create(self, **kwargs):
+        return _FakeCompletions.create(self, **kwargs)
+
+
+class _FakeAsyncClient(_FakeClient):
+    def __init__(self, *contents):
+        self.chat = SimpleNamespace(completions=_FakeAsyncCompletions(contents))
+
+
+def test_llm_discards_async_resolve_in_input_order():
+    client = _FakeAsyncClient('{"discard_indices": [0]}', '{"discard_indices": [1, 2]}')
+    agent = LLMAgent(model="test-model", async_client=client)
+    rules = DecisionRules()
+    hands = [
+        hand_from_strs(["2S", "KH", "KD", "9C", "9H"]),
+        hand_from_strs(["AS", "3H", "4D", "AC", "7H"]),
+    ]
+
+    decisions = asyncio.run(
+        agent.decide_discards_async([(hand, rules, None) for hand in hands])
+    )
+
+    assert [decision.discard_indices for decision in decisions] == [[0], [1, 2]]
+    assert agent.metrics()["api_calls"] == 2
+
+
+def test_made_hands_skip_the_llm_call():
+    client = _FakeClient()
+    agent = LLMAgent(client=client)
+    rules = DecisionRules()
+
+    straight = hand_from_strs(["9S", "8H", "7D", "6C", "5H"])
+    assert agent.decide_discard(straight, rules).discard_indices == []
+
+    quads = hand_from_strs(["QS", "QH", "3D", "QC", "QD"])
+    assert agent.decide_discard(quads, rules, _context()).discard_indices == [2]
+
+    assert client.calls == []
+    assert agent.metrics()["fallbacks"] == 0
+
+
+def test_no_draw_rules_skip_cache_and_llm():
+    client = _FakeClient()
+    agent = LLMAgent(client=client)
+    hand = hand_from_strs(["AS", "KH", "9D", "5C", "2H"])
+
+    decision = agent.decide_discard(hand, DecisionRules(max_discards=0), _context())
+
+    assert decision.discard_indices == []
+    assert client.calls == []
+    assert agent.metrics()["cache_misses"] == 0
+
+
+def test_validate_decision_rejects_malformed_indices():
+    agent = LLMAgent(client=None)
+    rules = DecisionRules(max_discards=3)
+
+    def valid(indices):
+        return agent._validate_decision(DiscardDecision(indices), 5, rules)
+
+    assert valid([])
+    assert valid([4, 0, 2])
+    assert not valid([1, 1])
+    assert not valid([-1])
+    assert not valid([5])
+    assert not valid(["1"])
+    assert not valid([True])
+    assert not valid([0, 1, 2, 3])
+
+
+def test_decision_cache_compaction_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    cache = DecisionCache(str(path))
+    cache.set("a", DiscardDecision([0], "é"))
+    cache.compact()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["decisions.jsonl"]
+    assert DecisionCache(str(path)).get("a").rationale == "é"
+
+
+def test_quota_errors_are_classified_by_error_code():
+    quota = RateLimitError.__new__(RateLimitError)
+    quota.code = "insufficient_quota"
+    throttled = RateLimitError.__new__(RateLimitError)
+    throttled.code = "rate_limit_exceeded"
+
+    assert _is_quota_error(quota)
+    assert not _is_quota_error(throttled)
+    assert not _is_quota_error(ValueError("insufficient_quota"))
+
+
+def test_llm_bet_retries_invalid_payload_through_shared_engine(monkeypatch):
+    client = _FakeClient('{"action": "shove", "amount": 0}', '{"action": "CALL", "amount": 0}')
+    agent = LLMAgent(
+        model="test-model", client=client, bet_mode="llm", max_retries=2, prompt_cache_key=True
+    )
+    monkeypatch.setattr("agent_llm.time.sleep", lambda _delay: None)
+    context = BettingContext(
+        game_id=1,
+        player_id=0,
+        round_id=1,
+        pot=20,
+        to_call=10,
+        current_bet=10,
+        min_bet=10,
+        min_raise=10,
+        stack=100,
+        committed=0,
+        available_actions=(BettingAction.FOLD, BettingAction.CALL, BettingAction.RAISE),
+        rng=random.Random(0),
+    )
+
+    decision = agent.decide_bet(hand_from_strs(["AS", "AH", "9D", "5C", "2H"]), context)
+
+    assert decision.action is BettingAction.CALL
+    assert len(client.calls) == 2
+    assert client.calls[0]["extra_body"] == {"prompt_cache_key": "fivecard-draw-bet-test-model"}
+    assert agent.metrics()["invalid_responses"] == 1
+
+
+def test_retry_backoff_is_capped_and_jittered():
+    assert 0.25 <= _retry_backoff(1) <= 0.5
+    for attempt in (3, 6, 20):
+        assert 1.0 <= _retry_backoff(attempt) <= 2.0
+
+
+def test_decision_cache_background_writer_flushes_on_threshold(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    cache = DecisionCache(str(path), flush_interval=60.0, flush_threshold=2)
+    cache.set("a", DiscardDecision([0]))
+    cache.set("b", DiscardDecision([1]))
+
+    deadline = time.monotonic() + 5.0
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    cache.set("c", DiscardDecision([2]))
+    cache.close()
+
+    reloaded = DecisionCache(str(path))
+    assert [reloaded.get(key).discard_indices for key in "abc"] == [(0,), (1,), (2,)]
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_mistyped_discard_payload_is_retried(monkeypatch):
+    monkeypatch.setattr("agent_llm.time.sleep", lambda _delay: None)
+    client = _FakeClient('{"discard_indices": ["3", true]}', '{"discard_indices": [4]}')
+    agent = LLMAgent(model="test-model", client=client, max_retries=2)
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    decision = agent.decide_discard(hand, DecisionRules())
+
+    assert decision.discard_indices == [4]
+    assert len(client.calls) == 2
+    assert agent.metrics()["fallbacks"] == 0
+
+
+def test_llm_discards_async_coalesce_identical_hands():
+    client = _FakeAsyncClient('{"discard_indices": [2, 3, 4]}')
+    agent = LLMAgent(model="test-model", async_client=client)
+    rules = DecisionRules()
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    decisions = asyncio.run(agent.decide_discards_async([(hand, rules, None)] * 3))
+
+    assert [list(decision.discard_indices) for decision in decisions] == [[2, 3, 4]] * 3
+    assert len(client.calls) == 1
+    metrics = agent.metrics()
+    assert (metrics["cache_misses"], metrics["cache_hits"]) == (1, 2)
+
+
+class _YieldingAsyncCompletions(_FakeCompletions):
+    async def create(self, **kwargs):
+        await asyncio.sleep(0)
+        return _FakeCompletions.create(self, **kwargs)
+
+
+def test_llm_discards_async_coalescing_survives_a_cancelled_leader():
+    client = _FakeAsyncClient()
+    client.chat.completions = _YieldingAsyncCompletions(
+        [asyncio.CancelledError(), '{"discard_indices": [1]}']
+    )
+    agent = LLMAgent(model="test-model", async_client=client)
+    rules = DecisionRules()
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    async def run():
+        return await asyncio.gather(
+            *(agent.decide_discard_async(hand, rules) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    leader, *followers = asyncio.run(run())
+
+    assert isinstance(leader, asyncio.CancelledError)
+    assert [list(decision.discard_indices) for decision in followers] == [[1], [1]]
+    assert len(client.calls) == 2
+    assert agent._in_flight == {}
+
+
+def test_llm_request_bounds_output_and_falls_back_on_unexpected_errors():
+    client = _FakeClient(RuntimeError("bug"), '{"discard_indices": []}')
+    agent = LLMAgent(model="test-model", client=client)
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    decision = agent.decide_discard(hand, DecisionRules())
+
+    assert decision.discard_indices == _conservative_fallback(hand, DecisionRules()).discard_indices
+    assert agent.metrics()["fallbacks"] == 1
+    assert len(client.calls) == 1
+    assert client.calls[0]["max_tokens"] == 256
+
+
+
+def test_llm_bet_falls_back_to_heuristic_on_unexpected_errors():
+    client = _FakeClient(RuntimeError("bug"), '{"action": "call", "amount": 0}')
+    agent = LLMAgent(model="test-model", client=client, bet_mode="llm")
+    context = BettingContext(
+        game_id=1,
+        player_id=0,
+        round_id=1,
+        pot=20,
+        to_call=10,
+        current_bet=10,
+        min_bet=10,
+        min_raise=10,
+        stack=100,
+        committed=0,
+        available_actions=(BettingAction.FOLD, BettingAction.CALL, BettingAction.RAISE),
+        rng=random.Random(0),
+    )
+
+    decision = agent.decide_bet(hand_from_strs(["AS", "AH", "9D", "5C", "2H"]), context)
+
+    assert decision.action in context.available_actions
+    assert len(client.calls) == 1
+
+def test_decision_cache_compacts_logs_dominated_by_stale_records(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    cache = DecisionCache(str(path))
+    for attempt in range(200):
+        cache.set("hot", DiscardDecision([attempt % 5]))
+        cache.sync()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 200
+
+    reloaded = DecisionCache(str(path))
+    reloaded.sync()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+    assert DecisionCache(str(path)).get("hot").discard_indices == (4,)
+
+
+def test_agents_sharing_a_cache_path_share_one_cache(tmp_path):
+    path = str(tmp_path / "shared.jsonl")
+    first = LLMAgent(client=None, cache_path=path)
+    second = LLMAgent(client=None, cache_path=path)
+    hand = hand_from_strs(["AS", "KH", "9D", "5C", "2H"])
+
+    first.decide_discard(hand, DecisionRules())
+    second.decide_discard(hand, DecisionRules())
+
+    assert get_cache(path) is get_cache(str(tmp_path / "." / "shared.jsonl"))
+    assert second.metrics()["cache_hits"] == 1
+    assert LLMAgent(client=None)._cache is not LLMAgent(client=None)._cache
+
+
+@pytest.mark.parametrize("error_type, status", [(NotFoundError, 404), (BadRequestError, 400)])
+def test_client_status_errors_are_tried_once(monkeypatch, capsys, error_type, status):
+    monkeypatch.setattr("agent_llm.time.sleep", lambda _delay: None)
+    error = error_type.__new__(error_type)
+    error.status_code = status
+    client = _FakeClient(error, '{"discard_indices": [4]}')
+    agent = LLMAgent(model="test-model", client=client, max_retries=3)
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    decision = agent.decide_discard(hand, DecisionRules())
+
+    assert len(client.calls) == 1
+    assert agent.metrics()["fallbacks"] == 1
+    assert decision.discard_indices == _conservative_fallback(hand, DecisionRules()).discard_indices
+    assert capsys.readouterr().out.count("不可用") == (1 if status == 404 else 0)
+
+
+def test_truncated_reply_falls_back_without_retrying(monkeypatch):
+    monkeypatch.setattr("agent_llm.time.sleep", lambda _delay: None)
+    truncated = SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                finish_reason="length",
+                message=SimpleNamespace(content='{"discard_indices": [4], "rationale": "Becau'),
+            )
+        ]
+    )
+    client = _FakeClient(truncated, '{"discard_indices": [4]}')
+    agent = LLMAgent(model="test-model", client=client, max_retries=3)
+    hand = hand_from_strs(["AS", "AH", "9D", "5C", "2H"])
+
+    decision = agent.decide_discard(hand, DecisionRules())
+
+    assert len(client.calls) == 1
+    assert agent.metrics()["fallbacks"] == 1
+    assert decision.discard_indices == _conservative_fallback(hand, DecisionRules()).discard_indices
@@ -0,0 +1,37 @@
+"""Unit tests for card encoding and deck dealing."""
+
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from deck import Card, Deck, hand_from_strs, hand_to_bitmask
+
+
+def test_card_codes_are_unique_and_drive_hashing():
+    deck = Deck()
+    codes = {card.code for card in deck.draw(52)}
+    assert codes == set(range(52))
+    assert hash(Card("A", "S")) == Card("A", "S").code
+    assert Card("A", "S") == Card("A", "S")
+
+
+def test_hand_bitmask_ignores_card_order():
+    hand = hand_from_strs(["AS", "KH", "7D", "2C", "9S"])
+    mask = hand_to_bitmask(hand)
+    assert mask == hand_to_bitmask(list(reversed(hand)))
+    assert bin(mask).count("1") == 5
+
+
+def test_draw_advances_and_shuffle_keeps_only_undealt_cards():
+    deck = Deck(rng=random.Random(3))
+    deck.shuffle()
+    first = deck.draw(5)
+    assert deck.remaining() == 47
+    deck.shuffle()
+    rest = deck.draw(47)
+    assert deck.remaining() == 0
+    assert len(set(first) | set(rest)) == 52
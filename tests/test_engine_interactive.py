@@ -73,3 +73,78 @@ def test_interactive_manual_flow_allows_external_actions():
     result = hand.showdown()
     assert isinstance(result, GameResult)
     assert result.pot >= 0
+
+
+def test_engine_reuses_deck_only_after_hand_completes():
+    engine = InteractiveFiveCardDrawEngine(_make_seats([200, 200]), rng=random.Random(6))
+    first = engine.start_hand(1)
+    abandoned = engine.start_hand(2)
+    assert abandoned.deck is not first.deck
+
+    abandoned.auto_play()
+    reused = engine.start_hand(3)
+    assert reused.deck is abandoned.deck
+    assert reused.deck.remaining() == 52 - 2 * 5
+
+
+def test_fold_out_skips_draw_phase():
+    class BetThenFold(RandomAgent):
+        def decide_bet(self, hand, context):
+            if BettingAction.BET in context.available_actions:
+                return BetDecision(BettingAction.BET, context.min_bet)
+            return BetDecision(BettingAction.FOLD)
+
+    seats = [
+        PlayerSeat(player_id=i, name=f"P{i}", agent=BetThenFold(), stack=100) for i in range(3)
+    ]
+    engine = InteractiveFiveCardDrawEngine(seats, rules=DecisionRules(min_bet=10), rng=random.Random(2))
+    hand = engine.start_hand(1)
+    result = hand.auto_play()
+
+    assert result.winners == [0]
+    assert hand.phase == hand.PHASE_COMPLETE
+    assert not any(event.type == "discard" for event in hand.events)
+
+
+def test_undersized_raise_is_lifted_to_call_plus_min_bet():
+    seats = [
+        PlayerSeat(player_id=0, name="Opener", agent=None, stack=200),
+        PlayerSeat(player_id=1, name="Raiser", agent=None, stack=200),
+    ]
+    engine = InteractiveFiveCardDrawEngine(seats, rules=DecisionRules(min_bet=20), rng=random.Random(1))
+    hand = engine.start_hand(1)
+
+    opener = hand.current_actor()
+    hand.apply_bet_decision(opener, BetDecision(BettingAction.BET, 20))
+    raiser = hand.current_actor()
+    hand.apply_bet_decision(raiser, BetDecision(BettingAction.RAISE, 25))
+
+    assert raiser.committed == 20 + 20
+    last = raiser.betting_history[-1]
+    assert (last.action, last.amount) == (BettingAction.RAISE, 40)
+    assert hand.pot == 60
+
+
+def test_active_count_tracks_folds_through_betting():
+    engine = InteractiveFiveCardDrawEngine(
+        _make_seats([100, 100, 100, 100]), rules=DecisionRules(min_bet=10), rng=random.Random(21)
+    )
+    for game_id in range(1, 40):
+        hand = engine.start_hand(game_id)
+        while hand.phase == hand.PHASE_BETTING and not hand.betting_complete():
+            actor = hand.current_actor()
+            hand.apply_bet_decision(actor, hand.auto_bet_for(actor))
+            live = sum(1 for player in hand.players if not player.folded)
+            assert hand._active_count == live
+            assert hand.betting_complete() == (live <= 1 or hand.peek_current_actor() is None)
+        hand.auto_play()
+
+
+def test_hand_records_bet_rationales_in_read_only_history():
+    engine = InteractiveFiveCardDrawEngine(_make_seats([200, 200]), rng=random.Random(3))
+    hand = engine.start_hand(1)
+    actor = hand.current_actor()
+    hand.apply_bet_decision(actor, BetDecision(BettingAction.CHECK, 0, "thinking out loud"))
+
+    assert actor.betting_history[-1].rationale == "thinking out loud"
+    assert isinstance(actor.betting_history, tuple)
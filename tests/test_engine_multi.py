@@ -188,3 +188,159 @@ def test_llm_agent_bluffs_high_card_with_randomness():
     )
     decision = agent.decide_bet(hand, context)
     assert decision.action == BettingAction.BET
+
+
+def test_available_actions_cover_each_betting_situation():
+    from engine import _available_actions, _RoundPlayer
+
+    check, bet, call, raise_, fold = (
+        BettingAction.CHECK,
+        BettingAction.BET,
+        BettingAction.CALL,
+        BettingAction.RAISE,
+        BettingAction.FOLD,
+    )
+    cases = [
+        # stack, to_call, min_bet, raises, expected
+        (100, 0, 10, 0, (check, bet)),
+        (100, 0, 0, 0, (check,)),
+        (0, 0, 10, 0, (check,)),
+        (100, 10, 10, 0, (call, raise_, fold)),
+        (100, 10, 10, 3, (call, fold)),
+        (15, 10, 10, 0, (call, fold)),
+        (10, 10, 10, 0, (call, fold)),
+        (0, 10, 10, 0, (fold,)),
+    ]
+    for stack, to_call, min_bet, raises, expected in cases:
+        rules = DecisionRules(min_bet=min_bet, max_raises=3)
+        player = _RoundPlayer(seat=PlayerSeat(0, "a", None, stack), hand=[], starting_stack=stack)
+        assert _available_actions(player, to_call, rules, raises) == expected
+
+
+def test_apply_discard_replaces_masked_positions_in_order():
+    from deck import Deck, hand_from_strs
+    from engine import _apply_discard
+
+    deck = Deck()
+    hand = hand_from_strs(["AS", "KH", "9D", "5C", "2H"])
+    top = deck.draw(2)
+    deck.reset()
+
+    assert _apply_discard(hand, [], deck) == hand
+    assert _apply_discard(hand, [3, 1, 3], deck) == [hand[0], hand[2], hand[4], *top]
+    assert deck.remaining() == 50
+
+
+def test_determine_winners_heads_up_and_split():
+    from deck import hand_from_strs
+    from engine import _determine_winners, _RoundPlayer
+    from hand_eval import evaluate_hand
+
+    def contender(player_id, cards):
+        hand = hand_from_strs(cards)
+        return _RoundPlayer(
+            seat=PlayerSeat(player_id, f"p{player_id}", None, 100),
+            hand=hand,
+            starting_stack=100,
+            hand_after=hand,
+            final_eval=evaluate_hand(hand),
+        )
+
+    pair = contender(0, ["AS", "AH", "9D", "5C", "2H"])
+    high = contender(1, ["KS", "QH", "9C", "5D", "3H"])
+    pair_twin = contender(2, ["AD", "AC", "9S", "5H", "2S"])
+
+    assert _determine_winners([pair]) == [pair]
+    assert _determine_winners([high, pair]) == [pair]
+    assert _determine_winners([pair, high]) == [pair]
+    assert _determine_winners([pair, pair_twin]) == [pair, pair_twin]
+    assert _determine_winners([high, pair, pair_twin]) == [pair, pair_twin]
+
+
+def test_betting_history_rows_materialise_as_events():
+    seats = [
+        PlayerSeat(player_id=0, name="Aggressor", agent=AggressiveAgent(), stack=100),
+        PlayerSeat(player_id=1, name="Folder", agent=FoldingAgent(), stack=100),
+    ]
+    engine = FiveCardDrawEngine(seats, rng=random.Random(0))
+    result = engine.play_game(1, DecisionRules(min_bet=10, ante=5))
+
+    for player in result.players:
+        events = player.betting_history
+        assert events[0].rationale == "Ante"
+        assert player.to_dict()["betting_history"] == [event.to_dict() for event in events]
+
+    # The result owns a real list, so appended events are kept and serialised.
+    winner = result.players[0]
+    winner.betting_history.append(winner.betting_history[0])
+    assert len(winner.to_dict()["betting_history"]) == len(winner.betting_history)
+
+
+def test_pay_winners_splits_odd_chips_to_earliest_seats():
+    from engine import BettingEvent, _pay_winners, _RoundPlayer
+
+    players = [
+        _RoundPlayer(seat=PlayerSeat(i, f"p{i}", None, 0), hand=[], starting_stack=0)
+        for i in range(3)
+    ]
+    _pay_winners(players[:1], 25)
+    assert players[0].seat.stack == 25
+    assert players[0].betting_history[-1] == BettingEvent(BettingAction.CALL, 25, "Payout", 0, 25)
+
+    _pay_winners(players, 20)
+    assert [player.seat.stack for player in players] == [32, 7, 6]
+    assert [player.betting_history[-1].pot_after for player in players] == [13, 6, 0]
+
+
+def test_plain_string_actions_are_coerced_to_enum_members():
+    class StringAgent(PassiveAgent):
+        def decide_bet(self, hand, context: BettingContext) -> BetDecision:
+            if context.to_call == 0 and BettingAction.BET in context.available_actions:
+                return BetDecision("bet", context.min_bet)
+            return BetDecision("fold")
+
+    seats = [
+        PlayerSeat(player_id=0, name="Strings", agent=StringAgent(), stack=100),
+        PlayerSeat(player_id=1, name="Strings2", agent=StringAgent(), stack=100),
+    ]
+    result = FiveCardDrawEngine(seats, rng=random.Random(0)).play_game(1, DecisionRules(min_bet=10))
+
+    assert result.winners == [0]
+    assert result.pot == 10
+    actions = [event.action for player in result.players for event in player.betting_history]
+    assert all(type(action) is BettingAction for action in actions)
+
+
+def test_raw_result_dict_uses_card_codes_and_rank_ids():
+    seats = [
+        PlayerSeat(player_id=0, name="Aggressor", agent=AggressiveAgent(), stack=100),
+        PlayerSeat(player_id=1, name="Passive", agent=PassiveAgent(), stack=100),
+    ]
+    result = FiveCardDrawEngine(seats, rng=random.Random(3)).play_game(1, DecisionRules(min_bet=10))
+
+    text = result.to_dict()
+    raw = result.to_dict(raw=True)
+    for player, text_player, raw_player in zip(result.players, text["players"], raw["players"]):
+        assert raw_player["hand_before"] == [card.code for card in player.hand_before]
+        assert raw_player["hand_after"] == [card.code for card in player.hand_after]
+        assert raw_player["initial_rank"] == player.initial_eval.rank_id
+        assert text_player["initial_rank"] == player.initial_eval.rank_name
+        assert raw_player["betting_history"] == text_player["betting_history"]
+
+    serialised = text["players"][0]["discard_indices"]
+    assert serialised is not result.players[0].decision.discard_indices
+    serialised.append(99)
+    assert 99 not in result.players[0].decision.discard_indices
+
+
+def test_validate_discard_rejects_bad_indices():
+    from engine import _validate_discard
+
+    rules = DecisionRules(max_discards=3)
+    assert _validate_discard([], 5, rules)
+    assert _validate_discard([4, 0, 2], 5, rules)
+    assert not _validate_discard([0, 1, 2, 3], 5, rules)
+    assert not _validate_discard([1, 1], 5, rules)
+    assert not _validate_discard([5], 5, rules)
+    assert not _validate_discard([-1], 5, rules)
+    assert not _validate_discard(["1"], 5, rules)
@@ -110,3 +110,69 @@ def test_compare_hands(first: str, second: str, expected: int) -> None:
     result = compare_hands(hand_a, hand_b)
     assert result == expected
 
+
+def test_evaluation_is_independent_of_card_order():
+    hand = make_hand("AS KS QS JS TS")
+    assert evaluate_hand(list(reversed(hand))) == evaluate_hand(hand)
+
+
+def test_lookup_tables_cover_every_hand_class():
+    from hand_eval import _FLUSH_LOOKUP, _UNSUITED_LOOKUP
+
+    assert len(_FLUSH_LOOKUP) == 1287
+    assert len(_UNSUITED_LOOKUP) == 6175
+    classes = {*_FLUSH_LOOKUP.values(), *_UNSUITED_LOOKUP.values()}
+    assert len(classes) == 7462
+
+
+def test_score_orders_hands_like_rank_and_tiebreak():
+    hands = [make_hand(cards) for cards, _ in EVALUATION_CASES]
+    evaluations = [evaluate_hand(hand) for hand in hands]
+    by_tuple = sorted(evaluations, key=lambda e: (e.rank_id, e.tiebreak))
+    assert sorted(evaluations, key=lambda e: e.score) == by_tuple
+    assert evaluate_hand(make_hand("AS KD QC 7H 4C")).score >> 20 == 0
+
+
+def test_evaluations_are_shared_across_suit_permutations():
+    pair = evaluate_hand(make_hand("AS AD 9C 7S 3D"))
+    assert evaluate_hand(make_hand("3H 7C AC 9D AH")) is pair
+
+    flush = evaluate_hand(make_hand("KD QD 9D 6D 3D"))
+    assert evaluate_hand(make_hand("3S 6S 9S QS KS")) is flush
+    assert evaluate_hand(make_hand("3S 6S 9S QS KH")) is not flush
+
+
+def test_evaluate_scores_matches_single_hand_evaluation():
+    from hand_eval import evaluate_scores
+
+    hands = [make_hand(cards) for cards, _ in EVALUATION_CASES]
+    hands.append(make_hand("AS AS KD KH 2C"))
+    assert evaluate_scores(hands) == [evaluate_hand(hand).score for hand in hands]
+    with pytest.raises(ValueError):
+        evaluate_scores([make_hand("AS KD")])
+
+
+def test_is_straight_uses_rank_bitmask_table():
+    from hand_eval import _STRAIGHT_HIGH_BY_MASK, _is_straight
+
+    assert len(_STRAIGHT_HIGH_BY_MASK) == 10
+    assert _is_straight([14, 13, 12, 11, 10]) == (True, 14)
+    assert _is_straight([14, 5, 4, 3, 2]) == (True, 5)
+    assert _is_straight([14, 13, 12, 11, 9]) == (False, 0)
+    assert _is_straight([9, 9, 8, 7, 6]) == (False, 0)
+
+
+def test_classify_orders_groups_by_count_then_rank():
+    from hand_eval import _classify
+
+    assert _classify([9, 9, 5, 5, 5], False).tiebreak == (5, 9)
+    assert _classify([13, 13, 8, 4, 4], False).tiebreak == (13, 4, 8)
+    # Five of one rank only arises from repeated cards and must not crash.
+    assert _classify([7, 7, 7, 7, 7], False).rank_name == "High Card"
+
+
+def test_rank_values_by_code_match_rank_value():
+    from deck import _FULL_DECK
+    from hand_eval import RANK_VALUE, _VALUE_BY_CODE
+
+    assert all(_VALUE_BY_CODE[card.code] == RANK_VALUE[card.rank] for card in _FULL_DECK)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import csv
+import json
+import random
+
+from engine import FiveCardDrawEngine, PlayerSeat
+from game_types import BetDecision, BettingAction, BettingContext, DecisionRules, DiscardDecision
+from logger import GameLogger
+
+
+class PassiveAgent:
+    def decide_bet(self, hand, context: BettingContext) -> BetDecision:
+        if BettingAction.CHECK in context.available_actions:
+            return BetDecision(BettingAction.CHECK)
+        return BetDecision(BettingAction.CALL, min(context.to_call, context.stack))
+
+    def decide_discard(self, hand, rules, context) -> DiscardDecision:
+        return DiscardDecision([])
+
+
+def _engine() -> FiveCardDrawEngine:
+    seats = [PlayerSeat(i, f"p{i}", PassiveAgent(), 100) for i in range(2)]
+    return FiveCardDrawEngine(seats, rng=random.Random(5))
+
+
+def test_game_logger_batches_flushes_until_close(tmp_path):
+    engine = _engine()
+    path = tmp_path / "games.csv"
+    logger = GameLogger(str(path), fmt="csv")
+    logger.FLUSH_EVERY = 2
+    logger.log(engine.play_game(1, DecisionRules()))
+    assert logger._pending == 1
+    logger.log(engine.play_game(2, DecisionRules()))
+    assert logger._pending == 0
+    logger.log(engine.play_game(3, DecisionRules()))
+    logger.close()
+
+    with open(path, encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["game_id"] for row in rows] == ["1", "2", "3"]
+
+
+def test_game_logger_writes_jsonl_bytes(tmp_path):
+    engine = _engine()
+    path = tmp_path / "games.jsonl"
+    results = [engine.play_game(game_id, DecisionRules()) for game_id in (1, 2)]
+    with GameLogger(str(path)) as logger:
+        for result in results:
+            logger.log(result)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["game_id"] for line in lines] == [1, 2]
+    assert json.loads(lines[0])["bankrolls"] == {
+        str(k): v for k, v in results[0].to_dict()["bankrolls"].items()
+    }
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from mini_flask import Flask
+
+
+def test_mini_flask_routes_match_compiled_patterns():
+    mini = Flask(__name__)
+
+    @mini.get("/api/games/<game_id>")
+    def show(game_id: str):
+        return {"game_id": game_id}
+
+    client = mini.test_client()
+    assert client.get("/api/games/7").get_json() == {"game_id": "7"}
+    assert client.get("//api/games//a.b/").get_json() == {"game_id": "a.b"}
+    assert client.get("/api/games").status_code == 404
+    assert client.post("/api/games/7").status_code == 404
+
+
+def test_mini_flask_prefers_static_first_segment_over_parameter():
+    mini = Flask(__name__)
+
+    @mini.get("/<name>")
+    def greet(name: str):
+        return {"name": name}
+
+    @mini.get("/health")
+    def health():
+        return {"ok": True}
+
+    client = mini.test_client()
+    assert client.get("/health").get_json() == {"ok": True}
+    assert client.get("/alice").get_json() == {"name": "alice"}
+
+
+@pytest.mark.parametrize("rule", ["/games/<int:game_id>", "/games/<game_id>/<game_id>"])
+def test_mini_flask_rejects_unsupported_route_parameters(rule: str):
+    mini = Flask(__name__)
+
+    with pytest.raises(ValueError, match="Unsupported route parameter"):
+        mini.get(rule)(lambda **params: params)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+
+from engine import FiveCardDrawEngine, PlayerSeat
+from game_types import BetDecision, BettingAction, BettingContext, DecisionRules, DiscardDecision
+from runner import StatsCollector
+
+
+class BettingAgent:
+    def decide_bet(self, hand, context: BettingContext) -> BetDecision:
+        if context.to_call == 0 and BettingAction.BET in context.available_actions:
+            return BetDecision(BettingAction.BET, max(context.min_bet, 1))
+        return BetDecision(BettingAction.CALL, min(context.to_call, context.stack))
+
+    def decide_discard(self, hand, rules, context) -> DiscardDecision:
+        return DiscardDecision([])
+
+
+class FoldingAgent(BettingAgent):
+    def decide_bet(self, hand, context: BettingContext) -> BetDecision:
+        if context.to_call > 0:
+            return BetDecision(BettingAction.FOLD)
+        return BetDecision(BettingAction.CHECK)
+
+
+def _play(seats, games: int):
+    engine = FiveCardDrawEngine(seats, rng=random.Random(2))
+    rules = DecisionRules(min_bet=10, ante=5)
+    return [engine.play_game(game_id, rules) for game_id in range(1, games + 1)]
+
+
+def test_stats_collector_counts_by_seat_position():
+    seats = [PlayerSeat(0, "p0", BettingAgent(), 100), PlayerSeat(1, "p1", FoldingAgent(), 100)]
+    stats = StatsCollector(seats)
+    for result in _play(seats, 3):
+        stats.update(result)
+
+    rows = {row["player_id"]: row for row in stats.summary(seats, {})["players"]}
+    assert rows[0]["wins"] == 3 and rows[1]["folds"] == 3
+    assert rows[0]["bankroll_change"] == -rows[1]["bankroll_change"] > 0
+    assert stats.wins == {0: 3, 1: 0}
+    assert stats.folds == {0: 0, 1: 3}
+    assert stats.initial_bankrolls == {0: 100, 1: 100}
+    assert stats.bankrolls[1] == rows[1]["bankroll"]
+
+
+def test_stats_collector_tolerates_unknown_player_ids():
+    seats = [PlayerSeat(0, "p0", BettingAgent(), 100), PlayerSeat(1, "p1", FoldingAgent(), 100)]
+    (result,) = _play(seats, 1)
+    stats = StatsCollector(seats)
+
+    stats.update(replace(result, winners=[7], bankrolls={**result.bankrolls, 7: 40}))
+
+    assert stats.wins[7] == 1
+    assert stats.bankrolls[7] == 40
+    assert [row["player_id"] for row in stats.summary(seats, {})["players"]] == [0, 1]